@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 from .actions import Action, ActionType, ActionResult, Direction, Position, ActionValidator
 import random
 
@@ -167,14 +167,47 @@ class GameState:
         self.grid_size = 3
         self._next_zombie_id = 0  # Counter for unique zombie IDs
         self.zombie_types_data = {}  # Will be loaded from JSON
+        # Living entities in insertion order, kept in step with add_* and entity_died
+        self._alive_survivors: List[Survivor] = []
+        self._alive_zombies: List[Zombie] = []
         
+    @property
+    def alive_survivors(self) -> Iterator[Survivor]:
+        """Iterate over the survivors that are still alive."""
+        return iter(self._alive_survivors)
+    
+    @property
+    def alive_zombies(self) -> Iterator[Zombie]:
+        """Iterate over the zombies that are still alive."""
+        return iter(self._alive_zombies)
+    
     def add_survivor(self, survivor: Survivor):
         """Add a survivor to the game state."""
         self.survivors.append(survivor)
+        if survivor.alive:
+            self._alive_survivors.append(survivor)
     
     def add_zombie(self, zombie: Zombie):
         """Add a zombie to the game state."""
         self.zombies.append(zombie)
+        if zombie.alive:
+            self._alive_zombies.append(zombie)
+    
+    def clear_survivors(self):
+        """Remove every survivor from the game state."""
+        self.survivors.clear()
+        self._alive_survivors.clear()
+    
+    def clear_zombies(self):
+        """Remove every zombie from the game state."""
+        self.zombies.clear()
+        self._alive_zombies.clear()
+    
+    def entity_died(self, entity: Entity):
+        """Drop an entity that has just died from the alive lists."""
+        alive = self._alive_survivors if isinstance(entity, Survivor) else self._alive_zombies
+        if entity in alive:
+            alive.remove(entity)
     
     def spawn_zombie(self, position: Position, zombie_type: str = "walker") -> Zombie:
         """Spawn a new zombie with a unique ID at the specified position."""
@@ -262,10 +295,12 @@ class GameState:
             if died:
                 message += f" and dies!"
                 effects.append(f"entity_died:{target.id}")
+                self.entity_died(target)
             effects.append(f"damage_taken:{target.id}:1")
             
         elif isinstance(target, Zombie):
             target.alive = False
+            self.entity_died(target)
             message = f"{actor.name} attacks {target.name} - {target.name} is eliminated!"
             effects.append(f"entity_died:{target.id}")
         
@@ -6,6 +6,7 @@ import json
 from typing import Dict, List, Any, Tuple, Optional
 from .entities import GameState, Survivor, Zombie
 from .actions import Position
+from utils.json_loader import load_json
 
 
 class GameSetupError(Exception):
@@ -18,6 +19,9 @@ class GameSetup:
     
     # Class variable to store weapons database
     _weapons_db = None
+    # Lowercased weapon name -> weapon entry, and the database it was built from
+    _weapons_by_name: Dict[str, Dict[str, Any]] = {}
+    _weapons_index_db = None
     
     @staticmethod
     def load_zombie_types_data(json_path: str = "zombie_types_db.json") -> Optional[Dict[str, Any]]:
@@ -34,8 +38,7 @@ class GameSetup:
             GameSetupError: If file cannot be loaded or parsed
         """
         try:
-            with open(json_path, 'r') as f:
-                zombie_types_data = json.load(f)
+            zombie_types_data = load_json(json_path)
             
             if 'zombie_types' not in zombie_types_data:
                 raise GameSetupError(f"Invalid zombie types file format: missing 'zombie_types' key in {json_path}")
@@ -65,8 +68,7 @@ class GameSetup:
             GameSetupError: If file cannot be loaded or parsed
         """
         try:
-            with open(json_path, 'r') as f:
-                weapons_data = json.load(f)
+            weapons_data = load_json(json_path)
             
             if 'weapons' not in weapons_data:
                 raise GameSetupError(f"Invalid weapons file format: missing 'weapons' key in {json_path}")
@@ -94,13 +96,18 @@ class GameSetup:
         Returns:
             Dictionary with weapon stats, or None if not found
         """
-        if not GameSetup._weapons_db:
+        weapons_db = GameSetup._weapons_db
+        if not weapons_db:
             return None
         
-        for weapon in GameSetup._weapons_db['weapons']:
-            if weapon['name'].lower() == weapon_name.lower():
-                return weapon
-        return None
+        if GameSetup._weapons_index_db is not weapons_db:
+            # First entry wins when two weapons share a name
+            index = {}
+            for weapon in weapons_db['weapons']:
+                index.setdefault(weapon['name'].lower(), weapon)
+            GameSetup._weapons_by_name = index
+            GameSetup._weapons_index_db = weapons_db
+        return GameSetup._weapons_by_name.get(weapon_name.lower())
     
     @staticmethod
     def load_map_data(json_path: str, map_index: int = 0) -> Optional[Dict[str, Any]]:
@@ -118,8 +125,7 @@ class GameSetup:
             GameSetupError: If there's an error loading or parsing the map data
         """
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            data = load_json(json_path)
             
             if "maps" not in data:
                 raise GameSetupError(f"Invalid map file format: missing 'maps' key")
@@ -153,8 +159,7 @@ class GameSetup:
             GameSetupError: If there's an error loading or parsing the survivor data
         """
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            data = load_json(json_path)
             
             if "survivors" not in data:
                 raise GameSetupError(f"Invalid survivor file format: missing 'survivors' key")
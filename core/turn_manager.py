@@ -117,9 +117,8 @@ class TurnManager:
         
         # Reset survivor actions for new turn
         if hasattr(self, '_current_game_state') and self._current_game_state:
-            for survivor in self._current_game_state.survivors:
-                if survivor.alive:
-                    survivor.actions_remaining = survivor.max_actions
+            for survivor in self._current_game_state.alive_survivors:
+                survivor.actions_remaining = survivor.max_actions
         
         # Reset initialization flags
         if hasattr(self, '_survivor_turn_initialized'):
@@ -522,6 +521,7 @@ class TurnManager:
         
         message = f"{zombie.name} attacks {survivor.name} - {survivor.name} takes 1 wound ({old_wounds + 1}/2)"
         if died:
+            game_state.entity_died(survivor)
             message += f" and dies!"
             print(f"    {message}")
             # Update survivor data to reflect death
@@ -1,6 +1,10 @@
+import functools
+from enum import IntEnum
 import pygame
 import json
 import sys
+from utils.json_loader import load_json
+from draw_survivors import preprocess_survivor
 
 # Constants for drawing
 TILE_SIZE = 3
@@ -11,202 +15,432 @@ WALL_COLOR = (0, 0, 0)  # black
 DOOR_COLOR = (0, 0, 255)  # blue
 MAP_START_X = 50
 MAP_START_Y = 50
+WALL_WIDTH = 4
+DOOR_SIZE = 40
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+DARK_GRAY = (64, 64, 64)
+LIGHT_GRAY = (200, 200, 200)
+
+# Survivor level colors for the card level indicator
+_LEVEL_COLORS = {
+    'blue': (0, 0, 255),
+    'yellow': (255, 255, 0),
+    'orange': (255, 165, 0),
+    'red': (255, 0, 0),
+}
+
+# Font sizes; the font objects are created by _init_fonts() once pygame is initialized
+FONT_LARGE = 24
+FONT_MEDIUM = 18
+FONT_SMALL = 14
+_FONTS = {}
+
+# Survivor cards are stacked to the right of the map
+CARD_START_X = MAP_START_X + (TILE_SIZE * ZONE_PIXEL_SIZE) + 50
+
+# Token properties
+TOKEN_DIAMETER = 40
+TOKEN_RADIUS = TOKEN_DIAMETER // 2
+TOKEN_BORDER_WIDTH = 2
+_TOKEN_COLORKEY = (255, 0, 255)  # magenta, never used by token art
+
+# Zone colors by feature; zones without any of these features are drawn as street
+_FEATURE_COLORS = (("building", BUILDING_COLOR),)
+
+# Longest time the viewer sleeps waiting for input before polling for state changes
+EVENT_WAIT_MS = 500
+
+# Zones (row, col) where survivor and zombie tokens are drawn
+SURVIVOR_TOKEN_ZONE = (0, 2)
+ZOMBIE_TOKEN_ZONE = (2, 2)
+
+class Dir(IntEnum):
+    """Zone connection directions; values index the per-direction geometry tables."""
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+# Per-direction geometry, indexed by Dir, as offsets from a zone's top-left corner:
+# wall line endpoints (dx0, dy0, dx1, dy1)
+_WALL_LINES = (
+    (0, 0, ZONE_PIXEL_SIZE, 0),
+    (0, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE),
+    (0, 0, 0, ZONE_PIXEL_SIZE),
+    (ZONE_PIXEL_SIZE, 0, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE),
+)
+# opened door line endpoints (dx0, dy0, dx1, dy1)
+_OPEN_DOOR_LINES = (
+    (ZONE_PIXEL_SIZE//2 - 20, 0, ZONE_PIXEL_SIZE//2, -20),
+    (ZONE_PIXEL_SIZE//2 - 20, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE//2, ZONE_PIXEL_SIZE + 20),
+    (0, ZONE_PIXEL_SIZE//2 - 20, -20, ZONE_PIXEL_SIZE//2),
+    (ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE//2 - 20, ZONE_PIXEL_SIZE + 20, ZONE_PIXEL_SIZE//2),
+)
+# closed door rects (dx, dy, width, height)
+_CLOSED_DOOR_RECTS = (
+    ((ZONE_PIXEL_SIZE - DOOR_SIZE) // 2, -3, DOOR_SIZE, 6),
+    ((ZONE_PIXEL_SIZE - DOOR_SIZE) // 2, ZONE_PIXEL_SIZE - 3, DOOR_SIZE, 6),
+    (-3, (ZONE_PIXEL_SIZE - DOOR_SIZE) // 2, 6, DOOR_SIZE),
+    (ZONE_PIXEL_SIZE - 3, (ZONE_PIXEL_SIZE - DOOR_SIZE) // 2, 6, DOOR_SIZE),
+)
+# door anchor point (middle of the wall)
+_DOOR_ANCHORS = (
+    (ZONE_PIXEL_SIZE//2, 0),
+    (ZONE_PIXEL_SIZE//2, ZONE_PIXEL_SIZE),
+    (0, ZONE_PIXEL_SIZE//2),
+    (ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE//2),
+)
+
+def _to_dir(direction):
+    """Convert a JSON direction name ("up", ...) to a Dir; returns None for unknown names."""
+    if isinstance(direction, Dir):
+        return direction
+    return Dir.__members__.get(direction.upper())
+
+def _zone_rect(zone_row, zone_col):
+    """Return the screen rect of the zone at (zone_row, zone_col)."""
+    return pygame.Rect(MAP_START_X + zone_col * ZONE_PIXEL_SIZE,
+                       MAP_START_Y + zone_row * ZONE_PIXEL_SIZE,
+                       ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE)
+
+def _door_rect(x, y, direction):
+    """Return a rect covering both the open and closed drawing of a door."""
+    dx, dy = _DOOR_ANCHORS[direction]
+    cx, cy = x + dx, y + dy
+    half = DOOR_SIZE // 2 + 4
+    return pygame.Rect(cx - half, cy - half, 2 * half, 2 * half)
 
 def draw_door(screen, x, y, direction, opened):
-    """Draw a door on the wall in the given direction at (x, y)."""
-    door_size = 40
-    
+    """Draw a door on the wall in the given direction (a Dir or its name) at (x, y)."""
+    direction = _to_dir(direction)
+    if direction is None:
+        return
     if opened:
         # Draw a 45º line (like a blueprint)
-        if direction == "up":
-            pygame.draw.line(screen, DOOR_COLOR,
-                           (x + ZONE_PIXEL_SIZE//2 - 20, y), 
-                           (x + ZONE_PIXEL_SIZE//2, y - 20), 3)
-        elif direction == "down":
-            pygame.draw.line(screen, DOOR_COLOR,
-                           (x + ZONE_PIXEL_SIZE//2 - 20, y + ZONE_PIXEL_SIZE), 
-                           (x + ZONE_PIXEL_SIZE//2, y + ZONE_PIXEL_SIZE + 20), 3)
-        elif direction == "left":
-            pygame.draw.line(screen, DOOR_COLOR,
-                           (x, y + ZONE_PIXEL_SIZE//2 - 20), 
-                           (x - 20, y + ZONE_PIXEL_SIZE//2), 3)
-        elif direction == "right":
-            pygame.draw.line(screen, DOOR_COLOR,
-                           (x + ZONE_PIXEL_SIZE, y + ZONE_PIXEL_SIZE//2 - 20), 
-                           (x + ZONE_PIXEL_SIZE + 20, y + ZONE_PIXEL_SIZE//2), 3)
+        dx0, dy0, dx1, dy1 = _OPEN_DOOR_LINES[direction]
+        pygame.draw.line(screen, DOOR_COLOR, (x + dx0, y + dy0), (x + dx1, y + dy1), 3)
     else:
         # Draw a small rectangle (closed door)
-        if direction == "up":
-            door_x = x + (ZONE_PIXEL_SIZE - door_size) // 2
-            pygame.draw.rect(screen, DOOR_COLOR, (door_x, y - 3, door_size, 6))
-        elif direction == "down":
-            door_x = x + (ZONE_PIXEL_SIZE - door_size) // 2
-            pygame.draw.rect(screen, DOOR_COLOR, (door_x, y + ZONE_PIXEL_SIZE - 3, door_size, 6))
-        elif direction == "left":
-            door_y = y + (ZONE_PIXEL_SIZE - door_size) // 2
-            pygame.draw.rect(screen, DOOR_COLOR, (x - 3, door_y, 6, door_size))
-        elif direction == "right":
-            door_y = y + (ZONE_PIXEL_SIZE - door_size) // 2
-            pygame.draw.rect(screen, DOOR_COLOR, (x + ZONE_PIXEL_SIZE - 3, door_y, 6, door_size))
+        dx, dy, w, h = _CLOSED_DOOR_RECTS[direction]
+        pygame.draw.rect(screen, DOOR_COLOR, (x + dx, y + dy, w, h))
 
-def draw_survivor_card(screen, survivor, x_pos, y_pos, card_width=280, card_height=380):
-    """Draw a survivor card at the specified position with white border, 3px width."""
-    # Colors
-    WHITE = (255, 255, 255)
-    BLACK = (0, 0, 0)
-    LIGHT_GRAY = (200, 200, 200)
-    BLUE = (0, 0, 255)
-    YELLOW = (255, 255, 0)
-    ORANGE = (255, 165, 0)
-    RED = (255, 0, 0)
+def zone_color(features):
+    """Return the fill color for a zone given its features (any iterable, ideally a frozenset)."""
+    if not isinstance(features, (set, frozenset)):
+        features = frozenset(features)
+    for feature, color in _FEATURE_COLORS:
+        if feature in features:
+            return color
+    return STREET_COLOR
+
+def _init_fonts():
+    """
+    Create the module fonts. Call after pygame.init(); fonts and text
+    rendered in a previous pygame session are discarded.
+    """
+    _token_surface.cache_clear()
+    _render_text.cache_clear()
+    _FONTS.clear()
+    for size in (FONT_LARGE, FONT_MEDIUM, FONT_SMALL):
+        _FONTS[size] = pygame.font.Font(None, size)
+
+@functools.lru_cache(maxsize=512)
+def _render_text(size, text, color):
+    """
+    Render antialiased text with the default font, caching the resulting surface.
+    The surface is converted to the display format, so the display mode must be set.
+    """
+    font = _FONTS.get(size)
+    if font is None:
+        font = _FONTS[size] = pygame.font.Font(None, size)
+    return font.render(text, True, color).convert_alpha()
+
+def _blit_batch(surface, blit_list):
+    """Blit a list of (source, dest) pairs in one call, using fblits on pygame-ce."""
+    fblits = getattr(surface, 'fblits', None)
+    if fblits is not None:
+        fblits(blit_list)
+    else:
+        surface.blits(blit_list, doreturn=False)
+
+def _prepare_zones(zones):
+    """Return a grid of (color, label, connections) tuples, one per zone, with connections keyed by Dir."""
+    prepared = []
+    for row in zones:
+        prepared_row = []
+        for zone in row:
+            features = zone["features"]
+            color = zone_color(frozenset(features))
+            conns = {}
+            for name, conn in zone.get("connections", {}).items():
+                direction = _to_dir(name)
+                if direction is not None:
+                    conns[direction] = conn
+            prepared_row.append((color, ','.join(features), conns))
+        prepared.append(prepared_row)
+    return prepared
+
+def _build_zone_geometry(prepared):
+    """
+    Lay out the prepared zone grid for drawing.
+    Returns (zones, doors) where zones is a list of (x, y, color, label, walls)
+    in draw order, walls holding ((x1, y1), (x2, y2), door_index) per wall
+    connection in the zone's connection order (door_index is None for plain
+    walls), and doors is a list of (x, y, direction, conn); the connection dict
+    is kept so the current "opened" state can be read per frame.
+    """
+    zones = []
+    doors = []
+    for zr, row in enumerate(prepared):
+        for zc, (color, label, conns) in enumerate(row):
+            x = MAP_START_X + zc * ZONE_PIXEL_SIZE
+            y = MAP_START_Y + zr * ZONE_PIXEL_SIZE
+            walls = []
+            for direction, conn in conns.items():
+                if conn["type"] != "wall":
+                    continue
+                door_index = None
+                if "door" in conn:
+                    door_index = len(doors)
+                    doors.append((x, y, direction, conn))
+                dx0, dy0, dx1, dy1 = _WALL_LINES[direction]
+                walls.append(((x + dx0, y + dy0), (x + dx1, y + dy1), door_index))
+            zones.append((x, y, color, label, tuple(walls)))
+    return zones, doors
+
+def _build_map_background(size, zones, doors, door_states):
+    """
+    Render the map (zone fills, borders, feature labels, walls and doors in
+    the given states) on a black surface of the given size.
+    Zones are drawn strictly in order, walls and doors included: each zone's
+    fill covers the parts of earlier zones' walls and opened doors that reach
+    into it.
+    """
+    background = pygame.Surface(size).convert()
+    background.fill((0, 0, 0))
     
-    level_colors = {'blue': BLUE, 'yellow': YELLOW, 'orange': ORANGE, 'red': RED}
+    # Bind hot callables to locals for the build loop
+    draw_rect = pygame.draw.rect
+    draw_line = pygame.draw.line
+    blit = background.blit
     
-    # Fonts
-    font_large = pygame.font.Font(None, 24)
-    font_medium = pygame.font.Font(None, 18)
-    font_small = pygame.font.Font(None, 14)
+    for x, y, color, label, walls in zones:
+        # Draw zone background
+        draw_rect(background, color, (x, y, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE))
+        
+        # Draw zone border
+        draw_rect(background, WALL_COLOR, (x, y, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE), 2)
+        
+        # Draw zone features text
+        text_surface = _render_text(FONT_SMALL, label, WALL_COLOR)
+        text_rect = text_surface.get_rect(center=(x + ZONE_PIXEL_SIZE//2, y + ZONE_PIXEL_SIZE//2))
+        blit(text_surface, text_rect)
+        
+        # Draw walls and doors
+        for start, end, door_index in walls:
+            draw_line(background, WALL_COLOR, start, end, WALL_WIDTH)
+            if door_index is not None:
+                draw_door(background, x, y, doors[door_index][2], door_states[door_index])
+    
+    return background
+
+def draw_survivor_card(screen, survivor, x_pos, y_pos, card_width=280, card_height=380):
+    """Draw a survivor card at the specified position with white border, 3px width."""
+    # Text is collected here and blitted in one batch after the shapes
+    blit_list = []
+    add_blit = blit_list.append
+    draw_rect = pygame.draw.rect
     
     # Draw card background with white border, 3 pixel width
-    pygame.draw.rect(screen, WHITE, (x_pos, y_pos, card_width, card_height), 3)
-    pygame.draw.rect(screen, LIGHT_GRAY, (x_pos + 3, y_pos + 3, card_width - 6, card_height - 6))
+    draw_rect(screen, WHITE, (x_pos, y_pos, card_width, card_height), 3)
+    draw_rect(screen, LIGHT_GRAY, (x_pos + 3, y_pos + 3, card_width - 6, card_height - 6))
     
     # Add survivor name
-    name_surface = font_large.render(survivor['name'], True, BLACK)
+    name_surface = _render_text(FONT_LARGE, survivor['name'], BLACK)
     name_rect = name_surface.get_rect(centerx=x_pos + card_width//2, y=y_pos + 10)
-    screen.blit(name_surface, name_rect)
+    add_blit((name_surface, name_rect))
     
     # Add level color indicator
-    level_color = level_colors.get(survivor['level'], LIGHT_GRAY)
+    level_color = _LEVEL_COLORS.get(survivor['level'], LIGHT_GRAY)
     level_rect = pygame.Rect(x_pos + 20, y_pos + 35, card_width - 40, 25)
-    pygame.draw.rect(screen, level_color, level_rect)
-    pygame.draw.rect(screen, BLACK, level_rect, 1)
+    draw_rect(screen, level_color, level_rect)
+    draw_rect(screen, BLACK, level_rect, 1)
     
-    level_surface = font_medium.render(survivor['level'].upper(), True, WHITE)
+    level_surface = _render_text(FONT_MEDIUM, survivor['level'].upper(), WHITE)
     level_text_rect = level_surface.get_rect(center=level_rect.center)
-    screen.blit(level_surface, level_text_rect)
+    add_blit((level_surface, level_text_rect))
     
     # Add wounds and experience
-    wounds_surface = font_medium.render(f"Wounds: {survivor['wounds']}", True, BLACK)
-    screen.blit(wounds_surface, (x_pos + 10, y_pos + 70))
+    wounds_surface = _render_text(FONT_MEDIUM, f"Wounds: {survivor['wounds']}", BLACK)
+    add_blit((wounds_surface, (x_pos + 10, y_pos + 70)))
     
-    exp_surface = font_medium.render(f"XP: {survivor['exp']}", True, BLACK)
-    screen.blit(exp_surface, (x_pos + 10, y_pos + 90))
+    exp_surface = _render_text(FONT_MEDIUM, f"XP: {survivor['exp']}", BLACK)
+    add_blit((exp_surface, (x_pos + 10, y_pos + 90)))
     
     # Add equipment (only non-empty items)
-    equipment_title = font_medium.render("Equipment:", True, BLACK)
-    screen.blit(equipment_title, (x_pos + 10, y_pos + 120))
+    equipment_title = _render_text(FONT_MEDIUM, "Equipment:", BLACK)
+    add_blit((equipment_title, (x_pos + 10, y_pos + 120)))
+    
+    if '_equipment_lines' not in survivor:
+        preprocess_survivor(survivor)
     
     y_offset = 140
-    for slot, item in survivor.get('equipment', {}).items():
-        if item and item != "empty":
-            equipment_text = f"{slot}: {item}"
-            equipment_surface = font_small.render(equipment_text, True, BLACK)
-            screen.blit(equipment_surface, (x_pos + 15, y_pos + y_offset))
-            y_offset += 18
-
-def draw_survivor_tokens(screen, survivors):
-    """Draw survivor tokens in zone (0,2) - white circles with black borders and names."""
-    if not survivors:
-        return
-        
-    # Zone (0,2) coordinates - zone at row 0, column 2
-    zone_row = 0
-    zone_col = 2
+    for equipment_text in survivor['_equipment_lines']:
+        equipment_surface = _render_text(FONT_SMALL, equipment_text, BLACK)
+        add_blit((equipment_surface, (x_pos + 15, y_pos + y_offset)))
+        y_offset += 18
+    
+    _blit_batch(screen, blit_list)
+
+def _card_key(survivor):
+    """Return the survivor fields shown on the card, used to detect when a card needs rebuilding."""
+    return (survivor['name'], survivor['level'], survivor['wounds'], survivor['exp'],
+            tuple(survivor.get('equipment', {}).items()))
+
+def build_survivor_card_surface(survivor, card_width=280, card_height=380):
+    """Render a survivor card to its own surface so it can be blitted every frame."""
+    card_surface = pygame.Surface((card_width, card_height)).convert()
+    draw_survivor_card(card_surface, survivor, 0, 0, card_width, card_height)
+    return card_surface
+
+def _token_centers(zone, count, tokens_per_row, spacing):
+    """Return the centers of up to count tokens laid out in rows inside a zone, dropping any that do not fit."""
+    zone_row, zone_col = zone
     zone_x = MAP_START_X + zone_col * ZONE_PIXEL_SIZE
     zone_y = MAP_START_Y + zone_row * ZONE_PIXEL_SIZE
-    
-    # Colors
-    WHITE = (255, 255, 255)
-    BLACK = (0, 0, 0)
-    
-    # Token properties
-    token_diameter = 40
-    token_radius = token_diameter // 2
-    border_width = 2
-    
-    # Position tokens within the zone
-    tokens_per_row = 3
-    spacing = 10
     start_x = zone_x + spacing
     start_y = zone_y + spacing
     
-    # Font for names
-    font_small = pygame.font.Font(None, 14)
-    
-    for i, survivor in enumerate(survivors):
+    centers = []
+    for i in range(count):
         # Calculate position for each token
         row = i // tokens_per_row
         col = i % tokens_per_row
         
-        token_x = start_x + col * (token_diameter + spacing) + token_radius
-        token_y = start_y + row * (token_diameter + spacing) + token_radius
+        token_x = start_x + col * (TOKEN_DIAMETER + spacing) + TOKEN_RADIUS
+        token_y = start_y + row * (TOKEN_DIAMETER + spacing) + TOKEN_RADIUS
         
         # Make sure token stays within zone bounds
-        if token_x + token_radius > zone_x + ZONE_PIXEL_SIZE or \
-           token_y + token_radius > zone_y + ZONE_PIXEL_SIZE:
+        if token_x + TOKEN_RADIUS > zone_x + ZONE_PIXEL_SIZE or \
+           token_y + TOKEN_RADIUS > zone_y + ZONE_PIXEL_SIZE:
+            centers.append(None)
+        else:
+            centers.append((token_x, token_y))
+    return centers
+
+@functools.lru_cache(maxsize=128)
+def _token_surface(fill_color, font_size, label, label_color):
+    """
+    Build a token sprite once: a filled circle with a black border and its
+    label centered on it. Circles are not antialiased, so the sprite is an
+    opaque surface with a colorkey. Labels wider than the token would leave
+    antialiased edges over the key color, so those sprites keep per-pixel alpha.
+    """
+    label_surface = _render_text(font_size, label, label_color)
+    width = max(TOKEN_DIAMETER, label_surface.get_width())
+    height = max(TOKEN_DIAMETER, label_surface.get_height())
+    center = (width // 2, height // 2)
+    
+    if width == TOKEN_DIAMETER and height == TOKEN_DIAMETER:
+        token = pygame.Surface((width, height))
+        token.fill(_TOKEN_COLORKEY)
+        token.set_colorkey(_TOKEN_COLORKEY)
+    else:
+        token = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.circle(token, fill_color, center, TOKEN_RADIUS)
+    pygame.draw.circle(token, BLACK, center, TOKEN_RADIUS, TOKEN_BORDER_WIDTH)
+    token.blit(label_surface, label_surface.get_rect(center=center))
+    if token.get_flags() & pygame.SRCALPHA:
+        return token.convert_alpha()
+    return token.convert()
+
+def layout_survivor_tokens(survivors):
+    """
+    Compute survivor token positions in zone (0,2) once.
+    Returns a list of (token_surface, dest_rect) for the tokens that fit.
+    """
+    layout = []
+    centers = _token_centers(SURVIVOR_TOKEN_ZONE, len(survivors), tokens_per_row=3, spacing=10)
+    for survivor, center in zip(survivors, centers):
+        if center is None:
             continue
-        
-        # Draw white circle with black border
-        pygame.draw.circle(screen, WHITE, (token_x, token_y), token_radius)
-        pygame.draw.circle(screen, BLACK, (token_x, token_y), token_radius, border_width)
-        
-        # Draw survivor name in the middle
-        name_surface = font_small.render(survivor['name'], True, BLACK)
-        name_rect = name_surface.get_rect(center=(token_x, token_y))
-        screen.blit(name_surface, name_rect)
+        token = _token_surface(WHITE, FONT_SMALL, survivor['name'], BLACK)
+        layout.append((token, token.get_rect(center=center)))
+    return layout
+
+def layout_zombie_tokens(num_zombies=2):
+    """
+    Compute zombie token positions in zone (2,2) once.
+    Returns a list of (token_surface, dest_rect) for the tokens that fit.
+    """
+    layout = []
+    token = _token_surface(DARK_GRAY, FONT_MEDIUM, 'Z', WHITE)
+    for center in _token_centers(ZOMBIE_TOKEN_ZONE, num_zombies, tokens_per_row=2, spacing=20):
+        if center is not None:
+            layout.append((token, token.get_rect(center=center)))
+    return layout
+
+def draw_survivor_tokens(screen, survivors, layout=None):
+    """Draw survivor tokens in zone (0,2) - white circles with black borders and names."""
+    if not survivors:
+        return
+    if layout is None:
+        layout = layout_survivor_tokens(survivors)
+    _blit_batch(screen, layout)
 
-def draw_zombie_tokens(screen):
+def draw_zombie_tokens(screen, layout=None):
     """Draw zombie tokens in zone (2,2) - dark grey circles with 'Z' in the middle."""
-    # Zone (2,2) coordinates - zone at row 2, column 2 (bottom-right)
-    zone_row = 2
-    zone_col = 2
-    zone_x = MAP_START_X + zone_col * ZONE_PIXEL_SIZE
-    zone_y = MAP_START_Y + zone_row * ZONE_PIXEL_SIZE
-    
-    # Colors
-    WHITE = (255, 255, 255)
-    BLACK = (0, 0, 0)
-    DARK_GRAY = (64, 64, 64)
-    
-    # Token properties
-    token_diameter = 40
-    token_radius = token_diameter // 2
-    border_width = 2
-    
-    # Position tokens within the zone
-    tokens_per_row = 2
-    spacing = 20
-    start_x = zone_x + spacing
-    start_y = zone_y + spacing
+    if layout is None:
+        # Draw only 2 zombie tokens
+        layout = layout_zombie_tokens(2)
+    _blit_batch(screen, layout)
+
+def load_map_data(json_path, map_index=0):
+    """
+    Load the zone grid of a map from a maps JSON file.
+    Raises FileNotFoundError, KeyError, IndexError or json.JSONDecodeError on bad input.
+    """
+    data = load_json(json_path)
+    map_data = data["maps"][map_index]
+    tile = map_data["tiles"][0][0]  # Only one tile for this map
+    return tile["zones"]
+
+def load_survivors(json_path):
+    """Load the survivor list from a survivors JSON file, or an empty list if the file is missing."""
+    try:
+        return [preprocess_survivor(survivor) for survivor in load_json(json_path)["survivors"]]
+    except FileNotFoundError:
+        print(f"Warning: {json_path} not found")
+        return []
+
+def _compose_frame(screen, background, card_surfaces, survivors, survivor_layout, zombie_layout):
+    """Compose one full frame from prebuilt map background, card surfaces and token layouts."""
+    # Restore the map background (also clears the rest of the screen)
+    screen.blit(background, (0, 0))
     
-    # Font for 'Z'
-    font_medium = pygame.font.Font(None, 18)
+    # Draw survivor cards to the right of the map
+    for i, card_surface in enumerate(card_surfaces):
+        screen.blit(card_surface, (CARD_START_X, MAP_START_Y + (i * 400)))
     
-    # Draw only 2 zombie tokens
-    num_zombies = 2
+    # Draw survivor tokens in zone (0,2)
+    draw_survivor_tokens(screen, survivors, survivor_layout)
     
-    for i in range(num_zombies):
-        # Calculate position for each token
-        row = i // tokens_per_row
-        col = i % tokens_per_row
-        
-        token_x = start_x + col * (token_diameter + spacing) + token_radius
-        token_y = start_y + row * (token_diameter + spacing) + token_radius
-        
-        # Make sure token stays within zone bounds
-        if token_x + token_radius > zone_x + ZONE_PIXEL_SIZE or \
-           token_y + token_radius > zone_y + ZONE_PIXEL_SIZE:
-            continue
-        
-        # Draw dark grey circle with black border
-        pygame.draw.circle(screen, DARK_GRAY, (token_x, token_y), token_radius)
-        pygame.draw.circle(screen, BLACK, (token_x, token_y), token_radius, border_width)
-        
-        # Draw 'Z' in the middle
-        z_surface = font_medium.render('Z', True, WHITE)
-        z_rect = z_surface.get_rect(center=(token_x, token_y))
-        screen.blit(z_surface, z_rect)
+    # Draw zombie tokens in zone (2,2)
+    draw_zombie_tokens(screen, zombie_layout)
+
+def render_map(screen, zones, survivors):
+    """
+    Render the map, survivor cards and tokens once onto an existing surface.
+    Lets other windows reuse the map drawing without starting this module's loop.
+    """
+    prepared = _prepare_zones(zones)
+    zone_geometry, doors = _build_zone_geometry(prepared)
+    door_states = tuple(conn.get("opened", False) for _, _, _, conn in doors)
+    background = _build_map_background(screen.get_size(), zone_geometry, doors, door_states)
+    card_surfaces = [build_survivor_card_surface(survivor) for survivor in survivors]
+    _compose_frame(screen, background, card_surfaces, survivors,
+                   layout_survivor_tokens(survivors), layout_zombie_tokens(2))
 
 def draw_map_from_json(json_path, map_index=0):
     """
@@ -215,6 +449,8 @@ def draw_map_from_json(json_path, map_index=0):
     """
     pygame.init()
     
+    _init_fonts()
+    
     # Create pygame window with exact 1200x1000 pixels
     screen = pygame.display.set_mode((1200, 1000))
     pygame.display.set_caption("Zombicide - Map and Survivors")
@@ -222,102 +458,96 @@ def draw_map_from_json(json_path, map_index=0):
     
     # Load map data
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        map_data = data["maps"][map_index]
-        tile = map_data["tiles"][0][0]  # Only one tile for this map
-        zones = tile["zones"]
+        zones = load_map_data(json_path, map_index)
     except (FileNotFoundError, KeyError, IndexError, json.JSONDecodeError) as e:
         print(f"Error loading map data: {e}")
         pygame.quit()
         sys.exit(1)
     
     # Load survivor data
-    try:
-        with open('survivors_db.json', 'r') as f:
-            survivors_data = json.load(f)
-        survivors = survivors_data["survivors"]
-    except FileNotFoundError:
-        survivors = []
-        print("Warning: survivors_db.json not found")
+    survivors = load_survivors('survivors_db.json')
 
-    # Fonts
-    font_small = pygame.font.Font(None, 14)
+    # Resolve per-zone (color, label, connections) once at parse time so the
+    # draw loop does no feature scans or string joins.
+    prepared = _prepare_zones(zones)
+    
+    # Zones, walls and doors are static, so build their geometry once
+    zone_geometry, doors = _build_zone_geometry(prepared)
     
+    # Only doors change, so the map is rendered once per combination of door
+    # states and cached
+    backgrounds = {}
+    
+    # Survivor cards are rendered to their own surfaces on first use
+    card_surfaces = [None] * len(survivors)
+    card_keys = [None] * len(survivors)
+    
+    # Regions of the window that must be pushed to the display this frame;
+    # the first frame (and any expose) presents the whole window.
+    dirty = [screen.get_rect()]
+    
+    # Token positions and labels only depend on the loaded data
+    survivor_layout = layout_survivor_tokens(survivors)
+    zombie_layout = layout_zombie_tokens(2)
+    
+    # Tokens are the dynamic part of the scene, so their zones are presented on every redraw
+    token_rects = [_zone_rect(*SURVIVOR_TOKEN_ZONE), _zone_rect(*ZOMBIE_TOKEN_ZONE)]
+    door_states = [conn.get("opened", False) for _, _, _, conn in doors]
+    
+    # Nothing animates between inputs, so the loop sleeps in event.wait()
+    # and only redraws when something changed
+    needs_redraw = True
     running = True
     while running:
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events, waking up at least every EVENT_WAIT_MS to poll for state changes
+        event = pygame.event.wait(EVENT_WAIT_MS)
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                dirty = [screen.get_rect()]
+                needs_redraw = True
         
-        # Clear screen with black background
-        screen.fill((0, 0, 0))
-        
-        # Draw zones
-        for zr in range(TILE_SIZE):
-            for zc in range(TILE_SIZE):
-                zone = zones[zr][zc]
-                x = MAP_START_X + zc * ZONE_PIXEL_SIZE
-                y = MAP_START_Y + zr * ZONE_PIXEL_SIZE
-
-                # Set color based on zone type
-                color = BUILDING_COLOR if "building" in zone["features"] else STREET_COLOR
-
-                # Draw zone background
-                pygame.draw.rect(screen, color, (x, y, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE))
-                
-                # Draw zone border
-                pygame.draw.rect(screen, WALL_COLOR, (x, y, ZONE_PIXEL_SIZE, ZONE_PIXEL_SIZE), 2)
-                
-                # Draw zone features text
-                features_text = ','.join(zone["features"])
-                text_surface = font_small.render(features_text, True, WALL_COLOR)
-                text_rect = text_surface.get_rect(center=(x + ZONE_PIXEL_SIZE//2, y + ZONE_PIXEL_SIZE//2))
-                screen.blit(text_surface, text_rect)
-
-                # Draw walls and doors
-                conns = zone.get("connections", {})
-                for direction, conn in conns.items():
-                    if conn["type"] == "wall":
-                        # Draw wall
-                        wall_width = 4
-                        if direction == "up":
-                            pygame.draw.line(screen, WALL_COLOR, 
-                                           (x, y), (x + ZONE_PIXEL_SIZE, y), wall_width)
-                        elif direction == "down":
-                            pygame.draw.line(screen, WALL_COLOR,
-                                           (x, y + ZONE_PIXEL_SIZE), (x + ZONE_PIXEL_SIZE, y + ZONE_PIXEL_SIZE), wall_width)
-                        elif direction == "left":
-                            pygame.draw.line(screen, WALL_COLOR,
-                                           (x, y), (x, y + ZONE_PIXEL_SIZE), wall_width)
-                        elif direction == "right":
-                            pygame.draw.line(screen, WALL_COLOR,
-                                           (x + ZONE_PIXEL_SIZE, y), (x + ZONE_PIXEL_SIZE, y + ZONE_PIXEL_SIZE), wall_width)
-                        
-                        # Draw door if present
-                        if "door" in conn:
-                            opened = conn.get("opened", False)
-                            draw_door(screen, x, y, direction, opened)
-
-        # Draw survivor cards to the right of the map
-        card_start_x = MAP_START_X + (TILE_SIZE * ZONE_PIXEL_SIZE) + 50  # Position to the right of the map
-        for i, survivor in enumerate(survivors):  # Show all survivors
-            card_y = MAP_START_Y + (i * 400)  # Stack cards vertically, one below the other
-            draw_survivor_card(screen, survivor, card_start_x, card_y)
+        # Only doors can change state; mark the ones that flipped as dirty
+        for i, (x, y, direction, conn) in enumerate(doors):
+            opened = conn.get("opened", False)
+            if opened != door_states[i]:
+                door_states[i] = opened
+                dirty.append(_door_rect(x, y, direction))
+                needs_redraw = True
         
-        # Draw survivor tokens in zone (0,2)
-        draw_survivor_tokens(screen, survivors)
+        # Rebuild a card surface only when the survivor's displayed fields changed
+        for i, survivor in enumerate(survivors):
+            key = _card_key(survivor)
+            if card_keys[i] != key:
+                card_keys[i] = key
+                card_surfaces[i] = build_survivor_card_surface(preprocess_survivor(survivor))
+                card_y = MAP_START_Y + (i * 400)  # Stack cards vertically, one below the other
+                dirty.append(card_surfaces[i].get_rect(topleft=(CARD_START_X, card_y)))
+                needs_redraw = True
         
-        # Draw zombie tokens in zone (2,2)
-        draw_zombie_tokens(screen)
+        if needs_redraw:
+            state_key = tuple(door_states)
+            background = backgrounds.get(state_key)
+            if background is None:
+                background = _build_map_background(screen.get_size(), zone_geometry, doors, state_key)
+                backgrounds[state_key] = background
+            
+            _compose_frame(screen, background, card_surfaces, survivors, survivor_layout, zombie_layout)
+            dirty.extend(token_rects)
+            needs_redraw = False
         
-        # Update display
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS
+        # Update only the changed regions; skip the call when nothing changed
+        if dirty:
+            pygame.display.update(dirty)
+            dirty.clear()
+        clock.tick(60)  # cap at 60 FPS while events keep arriving
     
     pygame.quit()
     print("Display closed")
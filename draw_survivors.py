@@ -1,5 +1,37 @@
 import pygame
 import json
+from utils.json_loader import load_json
+
+# Skill levels in unlock order
+SKILL_LEVELS = ('blue', 'yellow', 'orange1', 'orange2', 'red1', 'red2', 'red3')
+
+def _active_skills(survivor):
+    """Return the non-empty skills unlocked at the survivor's current level."""
+    skills = survivor.get('skills', {})
+    try:
+        current_level_index = SKILL_LEVELS.index(survivor['level'])
+        levels = SKILL_LEVELS[:current_level_index + 1]
+    except ValueError:
+        # If level not found in list, just show the blue skill
+        levels = ('blue',)
+    active = []
+    for level in levels:
+        skill = skills.get(f'skill_{level}')
+        if skill and skill != "empty":
+            active.append(skill)
+    return active
+
+def preprocess_survivor(survivor):
+    """
+    Precompute the text lines shown on a survivor card and store them on the
+    survivor dict as '_equipment_lines' and '_skill_lines'. Call again after
+    the survivor's equipment, level or skills change.
+    """
+    survivor['_equipment_lines'] = tuple(
+        f"{slot}: {item}" for slot, item in survivor.get('equipment', {}).items()
+        if item and item != "empty")
+    survivor['_skill_lines'] = tuple(f"• {skill}" for skill in _active_skills(survivor))
+    return survivor
 
 def draw_survivor_card(screen, survivor, x, y, width=280, height=380):
     """Draw a survivor card at the specified position using pygame."""
@@ -54,58 +86,49 @@ def draw_survivor_card(screen, survivor, x, y, width=280, height=380):
     equipment_title = font_medium.render("Equipment:", True, BLACK)
     screen.blit(equipment_title, (x + 10, y + 120))
     
+    if '_equipment_lines' not in survivor:
+        preprocess_survivor(survivor)
+    
     y_offset = 140
-    for slot, item in survivor.get('equipment', {}).items():
-        if item and item != "empty":
-            equipment_text = f"{slot}: {item}"
-            equipment_surface = font_small.render(equipment_text, True, BLACK)
-            screen.blit(equipment_surface, (x + 15, y + y_offset))
-            y_offset += 18
+    for equipment_text in survivor['_equipment_lines']:
+        equipment_surface = font_small.render(equipment_text, True, BLACK)
+        screen.blit(equipment_surface, (x + 15, y + y_offset))
+        y_offset += 18
     
     # Draw skills section
     skills_title = font_medium.render("Skills:", True, BLACK)
     screen.blit(skills_title, (x + 10, y + y_offset + 10))
     y_offset += 30
     
-    # Get active skills based on level
-    levels = ['blue', 'yellow', 'orange1', 'orange2', 'red1', 'red2', 'red3']
-    try:
-        current_level_index = levels.index(survivor['level'])
-        for level in levels[:current_level_index + 1]:
-            skill_key = f'skill_{level}'
-            if skill_key in survivor['skills']:
-                skill = survivor['skills'][skill_key]
-                if skill and skill != "empty":
-                    skill_surface = font_small.render(f"• {skill}", True, BLACK)
-                    screen.blit(skill_surface, (x + 15, y + y_offset))
-                    y_offset += 16
-    except ValueError:
-        # If level not found in list, just show the blue skill
-        if 'skill_blue' in survivor['skills']:
-            skill = survivor['skills']['skill_blue']
-            if skill and skill != "empty":
-                skill_surface = font_small.render(f"• {skill}", True, BLACK)
-                screen.blit(skill_surface, (x + 15, y + y_offset))
+    # Active skills based on level
+    for skill_text in survivor['_skill_lines']:
+        skill_surface = font_small.render(skill_text, True, BLACK)
+        screen.blit(skill_surface, (x + 15, y + y_offset))
+        y_offset += 16
+
+def draw_all_survivors_from_list(survivors, screen):
+    """Draw all survivor cards on the screen from already-loaded survivor data."""
+    # Position cards to the right of the map
+    card_width = 280
+    card_height = 380
+    card_start_x = 550  # Position to the right of the 450px wide map (50px margin + 450px map)
+    spacing = 20
+    
+    for i, survivor in enumerate(survivors):
+        card_y = 50 + (i * (card_height + spacing))
+        draw_survivor_card(screen, survivor, card_start_x, card_y, card_width, card_height)
 
 def draw_all_survivors(json_path, screen):
-    """Draw all survivor cards on the screen."""
+    """
+    Load survivors from a JSON file and draw all their cards on the screen.
+    This reads the file on every call; loops should load once and use
+    draw_all_survivors_from_list instead.
+    """
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
-        
-        survivors = data['survivors']
-        
-        # Position cards to the right of the map
-        card_width = 280
-        card_height = 380
-        card_start_x = 550  # Position to the right of the 450px wide map (50px margin + 450px map)
-        spacing = 20
-        
-        for i, survivor in enumerate(survivors):
-            card_y = 50 + (i * (card_height + spacing))
-            draw_survivor_card(screen, survivor, card_start_x, card_y, card_width, card_height)
+        data = load_json(json_path)
         
-        # Remove print to avoid console spam during game loop
+        survivors = [preprocess_survivor(survivor) for survivor in data['survivors']]
+        draw_all_survivors_from_list(survivors, screen)
         
     except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
         print(f"Error loading survivor data: {e}")
@@ -1,4 +1,5 @@
 import time
+from itertools import cycle
 
 YELLOW_THRESHOLD = 7
 ORANGE_THRESHOLD = 14
@@ -54,12 +55,18 @@ class TurnManager:
 		
 		return self.turn
 
+	def turns(self):
+		"""Iterate over turn indices: forever when looping, otherwise once through."""
+		if self.loop:
+			return cycle(range(self.total))
+		return iter(range(self.total))
+
 four_turns = TurnManager(4, False)
 four_turns_loop = TurnManager(4, True)
 
 global_turns = ["surv", "zomb", "spawn", "end"]
 global_turn_manager = TurnManager(len(global_turns), True)
 
-while True:
-    print(global_turns[global_turn_manager.next_turn()])
+for i in global_turn_manager.turns():
+    print(global_turns[i])
     time.sleep(0.4)
\ No newline at end of file
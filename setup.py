@@ -11,6 +11,9 @@ setup(
         "pytest>=7.3.1",
         "pyyaml>=6.0.1",
     ],
+    extras_require={
+        'fast-json': ["orjson>=3.9.0"],
+    },
     entry_points={
         'console_scripts': [
             'zombicide=zombicide.main:main',
@@ -2,12 +2,61 @@
 ConfigurationManager for the Zombicide game.
 Centralized configuration management following domain-driven design principles.
 """
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Dict, Tuple
-import pygame
+from typing import Dict, Tuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
+
+
+# Font name -> (font file, point size); fonts are created on first request
+_FONT_SPECS: Dict[str, Tuple[Optional[str], int]] = {
+    'xlarge': (None, 32),
+    'large': (None, 24),
+    'medium': (None, 20),
+    'small': (None, 16)
+}
+
+
+# Default palette (RGB tuples); each DisplayConfig gets its own copy
+_DEFAULT_COLORS: Dict[str, Tuple[int, int, int]] = {
+    'black': (0, 0, 0),
+    'white': (255, 255, 255),
+    'gray': (128, 128, 128),
+    'light_gray': (238, 238, 238),
+    'building_color': (210, 180, 140),
+    'street_color': (238, 238, 238),
+    'blue': (0, 0, 255),
+    'cyan': (0, 255, 255),
+    'yellow': (255, 255, 0),
+    'orange': (255, 165, 0),
+    'red': (255, 0, 0),
+    'dark_gray': (64, 64, 64)
+}
+
+# Default key bindings, built on first use so pygame is only imported when needed
+_DEFAULT_KEY_BINDINGS: Optional[Dict[str, int]] = None
+
+
+def _default_key_bindings() -> Dict[str, int]:
+    """Return a fresh copy of the default key bindings."""
+    global _DEFAULT_KEY_BINDINGS
+    if _DEFAULT_KEY_BINDINGS is None:
+        import pygame
+        _DEFAULT_KEY_BINDINGS = {
+            'quit': pygame.K_ESCAPE,
+            'phase_advance': pygame.K_SPACE,
+            'pause_toggle': pygame.K_p,
+            'action_1': pygame.K_1,
+            'action_2': pygame.K_2,
+            'action_3': pygame.K_3
+        }
+    return _DEFAULT_KEY_BINDINGS.copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """All display-related configuration in one place."""
     
@@ -17,20 +66,7 @@ class DisplayConfig:
     fps: int = 60
     
     # Colors (RGB tuples)
-    colors: Dict[str, Tuple[int, int, int]] = field(default_factory=lambda: {
-        'black': (0, 0, 0),
-        'white': (255, 255, 255),
-        'gray': (128, 128, 128),
-        'light_gray': (238, 238, 238),
-        'building_color': (210, 180, 140),
-        'street_color': (238, 238, 238),
-        'blue': (0, 0, 255),
-        'cyan': (0, 255, 255),
-        'yellow': (255, 255, 0),
-        'orange': (255, 165, 0),
-        'red': (255, 0, 0),
-        'dark_gray': (64, 64, 64)
-    })
+    colors: Dict[str, Tuple[int, int, int]] = field(default_factory=_DEFAULT_COLORS.copy)
     
     # Layout constants
     tile_size: int = 3
@@ -53,41 +89,48 @@ class DisplayConfig:
     menu_width: int = 300
     menu_height: int = 200
     
-    # Fonts (initialized after pygame setup)
+    # Fonts, created lazily by ConfigurationManager.get_font after pygame setup
     fonts: Dict[str, pygame.font.Font] = field(default_factory=dict)
     
-    def __post_init__(self):
-        """Initialize after creation."""
-        self._fonts_initialized = False
-    
     def initialize_fonts(self):
-        """Initialize pygame fonts. Call after pygame.init()."""
-        if not self._fonts_initialized:
-            self.fonts = {
-                'xlarge': pygame.font.Font(None, 32),
-                'large': pygame.font.Font(None, 24),
-                'medium': pygame.font.Font(None, 20),
-                'small': pygame.font.Font(None, 16)
-            }
-            self._fonts_initialized = True
-    
-    @property
-    def token_radius(self) -> int:
-        """Get token radius from diameter."""
-        return self.token_diameter // 2
-    
-    @property
-    def level_colors(self) -> Dict[str, Tuple[int, int, int]]:
-        """Get mapping of survivor levels to colors."""
-        return {
-            'blue': self.colors['blue'],
-            'yellow': self.colors['yellow'],
-            'orange': self.colors['orange'],
-            'red': self.colors['red']
+        """Create every configured font up front. Call after pygame.init()."""
+        import pygame
+        fonts = self.fonts
+        for name, spec in _FONT_SPECS.items():
+            if name not in fonts:
+                fonts[name] = pygame.font.Font(*spec)
+    
+    # Derived values, cached so per-frame renderer reads are plain attribute loads
+    token_radius: int = field(init=False, default=0, repr=False)
+    level_colors: Dict[str, Tuple[int, int, int]] = field(init=False, default_factory=dict, repr=False)
+    
+    def __post_init__(self):
+        self._rebuild_derived()
+    
+    def _rebuild_derived(self):
+        """Recompute the cached token radius and survivor level colors."""
+        self.token_radius = self.token_diameter // 2
+        colors = self.colors
+        self.level_colors = {
+            'blue': colors['blue'],
+            'yellow': colors['yellow'],
+            'orange': colors['orange'],
+            'red': colors['red']
         }
+    
+    def set_color(self, color_name: str, rgb: Tuple[int, int, int]):
+        """Set a named color, keeping the cached level colors in sync."""
+        self.colors[color_name] = rgb
+        if color_name in self.level_colors:
+            self.level_colors[color_name] = rgb
+    
+    def set_token_diameter(self, diameter: int):
+        """Set the token diameter, keeping the cached radius in sync."""
+        self.token_diameter = diameter
+        self.token_radius = diameter // 2
 
 
-@dataclass
+@dataclass(slots=True)
 class GameConfig:
     """Game-specific configuration."""
     
@@ -103,19 +146,12 @@ class GameConfig:
     show_coordinates: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class InputConfig:
     """Input handling configuration."""
     
     # Key bindings
-    key_bindings: Dict[str, int] = field(default_factory=lambda: {
-        'quit': pygame.K_ESCAPE,
-        'phase_advance': pygame.K_SPACE,
-        'pause_toggle': pygame.K_p,
-        'action_1': pygame.K_1,
-        'action_2': pygame.K_2,
-        'action_3': pygame.K_3
-    })
+    key_bindings: Dict[str, int] = field(default_factory=_default_key_bindings)
     
     # Mouse settings
     mouse_enabled: bool = True
@@ -130,10 +166,20 @@ class ConfigurationManager:
         self.display = DisplayConfig()
         self.game = GameConfig()
         self.input = InputConfig()
+        self._bind_lookups()
+    
+    def _bind_lookups(self):
+        """Snapshot the bound dict lookups used by get_color and get_font."""
+        self._color_get = self.display.colors.get
+        self._font_get = self.display.fonts.get
     
     def initialize_pygame_dependent_configs(self):
-        """Initialize configurations that depend on pygame being initialized."""
-        self.display.initialize_fonts()
+        """
+        Initialize configurations that depend on pygame being initialized.
+        
+        Fonts are no longer created here; get_font builds each one on first use.
+        """
+        self._bind_lookups()
     
     def update_window_size(self, width: int, height: int):
         """Update window dimensions."""
@@ -147,8 +193,24 @@ class ConfigurationManager:
     
     def get_color(self, color_name: str) -> Tuple[int, int, int]:
         """Get color by name with fallback to white."""
-        return self.display.colors.get(color_name, self.display.colors['white'])
+        color = self._color_get(color_name)
+        if color is None:
+            return self._color_get('white')
+        return color
     
     def get_font(self, font_name: str) -> pygame.font.Font:
-        """Get font by name with fallback to medium."""
-        return self.display.fonts.get(font_name, self.display.fonts.get('medium'))
\ No newline at end of file
+        """
+        Get font by name with fallback to medium.
+        
+        These are pygame.font (SDL_ttf) fonts. Renderers keep the surfaces they
+        render, so glyphs are only rasterised when a string is first shown.
+        """
+        font = self._font_get(font_name)
+        if font is None:
+            if font_name not in _FONT_SPECS:
+                font_name = 'medium'
+                font = self._font_get(font_name)
+            if font is None:
+                import pygame
+                font = self.display.fonts[font_name] = pygame.font.Font(*_FONT_SPECS[font_name])
+        return font
\ No newline at end of file
@@ -2,20 +2,33 @@
 GameLoop for the Zombicide game.
 Core game loop with timing and systems coordination.
 """
+from functools import partial
 import pygame
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from abc import ABC, abstractmethod
 
 from .configuration_manager import ConfigurationManager
 from .rendering_system import RenderingSystem
-from .input_system import InputSystem, InputEvent
+from .input_system import (
+    InputSystem, InputEvent, ACTION_KEY, ACTION_ADVANCE_PHASE, ACTION_TOGGLE_PAUSE,
+    ACTION_SURVIVOR_ACTION, ACTION_TARGET_SELECTION, ACTION_MOVE, ACTION_ATTACK,
+    ACTION_SKIP_TURN, ACTION_TOGGLE_DEBUG
+)
+
+
+# Shared read-only result for systems that have no changes to report
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
+# Window events after which the display contents can no longer be trusted
+_REDRAW_EVENTS = frozenset((pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED))
 
 
 class GameSystem(ABC):
     """Base class for all game systems."""
     
     @abstractmethod
-    def update(self, dt: int, game_world: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, dt: int, game_world: Dict[str, Any]) -> Mapping[str, Any]:
         """Update the system and return any state changes."""
         pass
 
@@ -27,24 +40,31 @@ class TimingSystem(GameSystem):
         self.config = config_manager
         self.clock = pygame.time.Clock()
         self.last_time = pygame.time.get_ticks()
+        self._target_fps = config_manager.display.fps
+        
+        # Result dict reused every frame; fps is only measured in debug mode
+        self._timing = {
+            "delta_time": 0,
+            "fps": 0.0,
+            "target_fps": self._target_fps
+        }
+        self._result = {"timing": self._timing}
     
-    def update(self, dt: int, game_world: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, dt: int, game_world: Dict[str, Any]) -> Mapping[str, Any]:
         """Update timing information."""
         current_time = pygame.time.get_ticks()
-        actual_dt = current_time - self.last_time
+        timing = self._timing
+        timing["delta_time"] = current_time - self.last_time
         self.last_time = current_time
         
-        return {
-            "timing": {
-                "delta_time": actual_dt,
-                "fps": self.clock.get_fps(),
-                "target_fps": self.config.display.fps
-            }
-        }
+        if self.config.game.debug_mode:
+            timing["fps"] = self.clock.get_fps()
+        
+        return self._result
     
     def tick(self) -> int:
         """Maintain target FPS and return delta time."""
-        return self.clock.tick(self.config.display.fps)
+        return self.clock.tick(self._target_fps)
 
 
 class GameStateSystem(GameSystem):
@@ -53,38 +73,33 @@ class GameStateSystem(GameSystem):
     def __init__(self, turn_manager, game_state):
         self.turn_manager = turn_manager
         self.game_state = game_state
+        
+        # Only some turn managers implement zombie attack target selection
+        self._supports_target_selection = hasattr(turn_manager, 'waiting_for_survivor_selection')
+        
+        # Import here to avoid circular imports
+        from core.turn_manager import TurnPhase
+        
+        # Turn phase -> per-frame processing step
+        self._phase_handlers = {
+            TurnPhase.SURVIVOR_TURN: partial(turn_manager.process_survivor_turn, game_state),
+            TurnPhase.ZOMBIE_TURN: partial(turn_manager.process_zombie_turn, game_state),
+            TurnPhase.ZOMBIE_SPAWN: turn_manager.process_zombie_spawn,
+            TurnPhase.TURN_END: turn_manager.process_turn_end
+        }
     
-    def update(self, dt: int, game_world: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, dt: int, game_world: Dict[str, Any]) -> Mapping[str, Any]:
         """Update game state through turn manager."""
         if not game_world.get("running", True):
-            return {}
+            return _EMPTY_DICT
         
         # Update turn manager
         self.turn_manager.update(dt)
         
         # Process current turn phase
-        current_phase = self.turn_manager.get_current_phase()
-        
-        # Import here to avoid circular imports
-        from core.turn_manager import TurnPhase
-        
-        if current_phase == TurnPhase.SURVIVOR_TURN:
-            self.turn_manager.process_survivor_turn(self.game_state)
-        elif current_phase == TurnPhase.ZOMBIE_TURN:
-            self.turn_manager.process_zombie_turn(self.game_state)
-        elif current_phase == TurnPhase.ZOMBIE_SPAWN:
-            self.turn_manager.process_zombie_spawn()
-        elif current_phase == TurnPhase.TURN_END:
-            self.turn_manager.process_turn_end()
-        
-        # Build combat info if zombie combat is active
-        combat_info = None
-        if hasattr(self.turn_manager, 'waiting_for_survivor_selection') and self.turn_manager.waiting_for_survivor_selection:
-            combat_info = {
-                'waiting_for_selection': True,
-                'message': getattr(self.turn_manager, 'combat_message', 'Combat!'),
-                'target_survivors': getattr(self.turn_manager, 'available_target_survivors', [])
-            }
+        phase_handler = self._phase_handlers.get(self.turn_manager.get_current_phase())
+        if phase_handler:
+            phase_handler()
         
         # Check if we're waiting for phase advance
         phase_advance_info = None
@@ -94,14 +109,23 @@ class GameStateSystem(GameSystem):
                 'message': self.turn_manager.get_phase_advance_message()
             }
         
-        return {
+        changes = {
             "turn_info": self.turn_manager.get_turn_info(),
             "current_survivor": self.turn_manager.get_current_survivor(),
             "available_actions": (self.turn_manager.get_available_actions() 
                                 if self.turn_manager.is_waiting_for_action() else None),
-            "combat_info": combat_info,
             "phase_advance_info": phase_advance_info
         }
+        
+        # Add combat info only while zombie combat is waiting on a target
+        if self._supports_target_selection and self.turn_manager.waiting_for_survivor_selection:
+            changes["combat_info"] = {
+                'waiting_for_selection': True,
+                'message': getattr(self.turn_manager, 'combat_message', 'Combat!'),
+                'target_survivors': getattr(self.turn_manager, 'available_target_survivors', [])
+            }
+        
+        return changes
 
 
 class GameActionProcessor:
@@ -109,81 +133,107 @@ class GameActionProcessor:
     
     def __init__(self, turn_manager):
         self.turn_manager = turn_manager
+        self._direction_map = None
+        self._supports_target_selection = hasattr(turn_manager, 'waiting_for_survivor_selection')
+        
+        # Action name -> handler; each handler records its results in state_changes
+        self._dispatch = {
+            ACTION_ADVANCE_PHASE: self._do_advance_phase,
+            ACTION_TOGGLE_PAUSE: self._do_toggle_pause,
+            ACTION_SURVIVOR_ACTION: self._do_survivor_action,
+            ACTION_TARGET_SELECTION: self._do_target_selection,
+            ACTION_MOVE: self._do_move,
+            ACTION_ATTACK: self._do_attack,
+            ACTION_SKIP_TURN: self._do_skip_turn,
+            ACTION_TOGGLE_DEBUG: self._do_toggle_debug,
+        }
     
-    def process_actions(self, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_actions(self, actions: List[Mapping[str, Any]]) -> Dict[str, Any]:
         """Process a list of game actions."""
         state_changes = {}
+        dispatch = self._dispatch
         
         for action in actions:
-            action_type = action.get("action")
-            
-            if action_type == "advance_phase":
-                # Check if we're waiting for phase advance (e.g., between survivor and zombie turns)
-                if self.turn_manager.is_waiting_for_phase_advance():
-                    success = self.turn_manager.advance_to_next_phase()
-                    state_changes["phase_advanced"] = success
-                elif not self.turn_manager.is_waiting_for_action():
-                    self.turn_manager.advance_phase()
-                    state_changes["phase_advanced"] = True
-            
-            elif action_type == "toggle_pause":
-                self.turn_manager.game_paused = not self.turn_manager.game_paused
-                state_changes["game_paused"] = self.turn_manager.game_paused
-            
-            elif action_type == "survivor_action":
-                if self.turn_manager.is_waiting_for_action():
-                    action_index = action.get("action_index", -1)
-                    if action_index >= 0:
-                        success = self.turn_manager.select_action(action_index)
-                        state_changes["action_selected"] = success
-                        if not success:
-                            state_changes["invalid_action"] = action_index
-            
-            elif action_type == "survivor_target_selection":
-                if hasattr(self.turn_manager, 'waiting_for_survivor_selection') and self.turn_manager.waiting_for_survivor_selection:
-                    target_index = action.get("target_index", -1)
-                    if target_index >= 0:
-                        success = self.turn_manager.select_survivor_target(target_index)
-                        state_changes["target_selected"] = success
-                        if not success:
-                            state_changes["invalid_target"] = target_index
-            
-            elif action_type == "move":
-                if self.turn_manager.is_waiting_for_action():
-                    direction_str = action.get("direction")
-                    if direction_str:
-                        # Import Direction here to avoid circular imports
-                        from core.actions import Direction
-                        direction_map = {
-                            "UP": Direction.UP,
-                            "DOWN": Direction.DOWN,
-                            "LEFT": Direction.LEFT,
-                            "RIGHT": Direction.RIGHT
-                        }
-                        direction = direction_map.get(direction_str)
-                        if direction:
-                            success = self.turn_manager.execute_move(direction)
-                            state_changes["move_executed"] = success
-                            if not success:
-                                state_changes["invalid_move"] = direction_str
-            
-            elif action_type == "attack":
-                if self.turn_manager.is_waiting_for_action():
-                    success = self.turn_manager.execute_attack()
-                    state_changes["attack_executed"] = success
-                    if not success:
-                        state_changes["invalid_attack"] = True
-            
-            elif action_type == "skip_turn":
-                if self.turn_manager.is_waiting_for_action():
-                    success = self.turn_manager.execute_skip_turn()
-                    state_changes["skip_turn_executed"] = success
-            
-            elif action_type == "toggle_debug":
-                # This would be handled by the configuration manager
-                state_changes["debug_toggled"] = True
+            handler = dispatch.get(action.get(ACTION_KEY))
+            if handler:
+                handler(action, state_changes)
         
         return state_changes
+    
+    def _do_advance_phase(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Advance the turn phase."""
+        # Check if we're waiting for phase advance (e.g., between survivor and zombie turns)
+        if self.turn_manager.is_waiting_for_phase_advance():
+            success = self.turn_manager.advance_to_next_phase()
+            state_changes["phase_advanced"] = success
+        elif not self.turn_manager.is_waiting_for_action():
+            self.turn_manager.advance_phase()
+            state_changes["phase_advanced"] = True
+    
+    def _do_toggle_pause(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Toggle the paused state."""
+        self.turn_manager.game_paused = not self.turn_manager.game_paused
+        state_changes["game_paused"] = self.turn_manager.game_paused
+    
+    def _do_survivor_action(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Select one of the current survivor's actions."""
+        if self.turn_manager.is_waiting_for_action():
+            action_index = action.get("action_index", -1)
+            if action_index >= 0:
+                success = self.turn_manager.select_action(action_index)
+                state_changes["action_selected"] = success
+                if not success:
+                    state_changes["invalid_action"] = action_index
+    
+    def _do_target_selection(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Select the survivor targeted by a zombie attack."""
+        if self._supports_target_selection and self.turn_manager.waiting_for_survivor_selection:
+            target_index = action.get("target_index", -1)
+            if target_index >= 0:
+                success = self.turn_manager.select_survivor_target(target_index)
+                state_changes["target_selected"] = success
+                if not success:
+                    state_changes["invalid_target"] = target_index
+    
+    def _do_move(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Move the current survivor."""
+        if self.turn_manager.is_waiting_for_action():
+            direction_str = action.get("direction")
+            if direction_str:
+                if self._direction_map is None:
+                    # Import Direction here to avoid circular imports
+                    from core.actions import Direction
+                    self._direction_map = {
+                        "UP": Direction.UP,
+                        "DOWN": Direction.DOWN,
+                        "LEFT": Direction.LEFT,
+                        "RIGHT": Direction.RIGHT
+                    }
+                direction = self._direction_map.get(direction_str)
+                if direction:
+                    success = self.turn_manager.execute_move(direction)
+                    state_changes["move_executed"] = success
+                    if not success:
+                        state_changes["invalid_move"] = direction_str
+    
+    def _do_attack(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Attack with the current survivor."""
+        if self.turn_manager.is_waiting_for_action():
+            success = self.turn_manager.execute_attack()
+            state_changes["attack_executed"] = success
+            if not success:
+                state_changes["invalid_attack"] = True
+    
+    def _do_skip_turn(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Skip the current survivor's turn."""
+        if self.turn_manager.is_waiting_for_action():
+            success = self.turn_manager.execute_skip_turn()
+            state_changes["skip_turn_executed"] = success
+    
+    def _do_toggle_debug(self, action: Mapping[str, Any], state_changes: Dict[str, Any]):
+        """Flag a debug toggle."""
+        # This would be handled by the configuration manager
+        state_changes["debug_toggled"] = True
 
 
 class GameWorld:
@@ -203,31 +253,41 @@ class GameWorld:
         self.available_actions = None
         self.show_action_menu = False
         self.phase_advance_info = None
+        
+        # Attributes that system changes may overwrite
+        self._updatable = frozenset(self.__dict__)
+        
+        # Render dicts are reused every frame and refreshed in get_render_data
+        self._render_game_world = {}
+        self._render_ui_state = {}
+        self._render_data = (self._render_game_world, self._render_ui_state)
     
-    def update_from_changes(self, changes: Dict[str, Any]):
+    def update_from_changes(self, changes: Mapping[str, Any]):
         """Update world state from system changes."""
+        if not changes:
+            return
+        state = self.__dict__
+        updatable = self._updatable
         for key, value in changes.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+            if key in updatable:
+                state[key] = value
     
     def get_render_data(self) -> tuple:
-        """Get data needed for rendering."""
-        game_world = {
-            "map_data": self.map_data,
-            "survivors": self.survivors,
-            "zombies": self.zombies,
-            "survivors_data": self.survivors_data
-        }
+        """Get data needed for rendering. The returned dicts are reused between calls."""
+        game_world = self._render_game_world
+        game_world["map_data"] = self.map_data
+        game_world["survivors"] = self.survivors
+        game_world["zombies"] = self.zombies
+        game_world["survivors_data"] = self.survivors_data
         
-        ui_state = {
-            "turn_info": self.turn_info,
-            "current_survivor": self.current_survivor,
-            "available_actions": self.available_actions,
-            "show_action_menu": self.available_actions is not None,
-            "phase_advance_info": self.phase_advance_info
-        }
+        ui_state = self._render_ui_state
+        ui_state["turn_info"] = self.turn_info
+        ui_state["current_survivor"] = self.current_survivor
+        ui_state["available_actions"] = self.available_actions
+        ui_state["show_action_menu"] = self.available_actions is not None
+        ui_state["phase_advance_info"] = self.phase_advance_info
         
-        return game_world, ui_state
+        return self._render_data
 
 
 class GameLoop:
@@ -248,6 +308,10 @@ class GameLoop:
         
         # State
         self.running = True
+        
+        # Per-frame state dicts handed to the systems, refreshed in place
+        self._world_dict: Dict[str, Any] = {}
+        self._game_state_dict: Dict[str, Any] = {}
     
     def set_game_components(self, turn_manager, game_state):
         """Set game-specific components after game data is loaded."""
@@ -286,8 +350,13 @@ class GameLoop:
     
     def handle_input(self):
         """Process input through the input system."""
-        # Let the input system handle all events
-        events = self.input_system.process_input()
+        # Drain the pygame queue once and let the input system convert the events
+        pygame_events = pygame.event.get()
+        events = self.input_system.process_input(pygame_events)
+        
+        # Frames only push changed strips, so an uncovered or resized window needs a full redraw
+        if any(event.type in _REDRAW_EVENTS for event in pygame_events):
+            self.rendering_system.invalidate()
         
         if self.input_system.is_quit_requested():
             self.running = False
@@ -321,23 +390,25 @@ class GameLoop:
         self.rendering_system.render(game_world, ui_state)
     
     def _get_world_dict(self) -> Dict[str, Any]:
-        """Get world state as dictionary."""
-        return {
-            "running": self.running,
-            "map_data": self.world.map_data,
-            "survivors": self.world.survivors,
-            "zombies": self.world.zombies,
-            "game_state": self.world.game_state
-        }
+        """Get world state as dictionary. The same dict is refreshed and returned each call."""
+        world = self.world
+        world_dict = self._world_dict
+        world_dict["running"] = self.running
+        world_dict["map_data"] = world.map_data
+        world_dict["survivors"] = world.survivors
+        world_dict["zombies"] = world.zombies
+        world_dict["game_state"] = world.game_state
+        return world_dict
     
     def _get_game_state_dict(self) -> Dict[str, Any]:
-        """Get current game state for event processing."""
-        return {
-            "turn_info": self.world.turn_info,
-            "current_survivor": self.world.current_survivor,
-            "waiting_for_action": self.world.available_actions is not None,
-            "waiting_for_phase_advance": self.world.phase_advance_info is not None
-        }
+        """Get current game state for event processing. The same dict is refreshed and returned each call."""
+        world = self.world
+        state = self._game_state_dict
+        state["turn_info"] = world.turn_info
+        state["current_survivor"] = world.current_survivor
+        state["waiting_for_action"] = world.available_actions is not None
+        state["waiting_for_phase_advance"] = world.phase_advance_info is not None
+        return state
     
     def stop(self):
         """Stop the game loop."""
@@ -2,32 +2,60 @@
 InputSystem for the Zombicide game.
 Handles input processing and event generation in a domain-focused manner.
 """
+import sys
 import pygame
-from typing import List, Optional, Dict, Any
+from pygame import (
+    QUIT as _QUIT, KEYDOWN as _KEYDOWN,
+    K_UP as _K_UP, K_DOWN as _K_DOWN, K_LEFT as _K_LEFT, K_RIGHT as _K_RIGHT,
+    K_a as _K_A, K_F1 as _K_F1
+)
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Iterable
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum, auto
 
 from .configuration_manager import ConfigurationManager
 
 
-class InputEventType(Enum):
+class InputEventType(IntEnum):
     """Types of input events that can be generated."""
-    QUIT = "quit"
-    PHASE_ADVANCE = "phase_advance"
-    PAUSE_TOGGLE = "pause_toggle"
-    SURVIVOR_ACTION = "survivor_action"
-    DEBUG_TOGGLE = "debug_toggle"
-    MOVE = "move"
-    ATTACK = "attack"
-    SKIP_TURN = "skip_turn"
-    UNKNOWN = "unknown"
-
-
-@dataclass
+    QUIT = auto()
+    PHASE_ADVANCE = auto()
+    PAUSE_TOGGLE = auto()
+    SURVIVOR_ACTION = auto()
+    DEBUG_TOGGLE = auto()
+    MOVE = auto()
+    ATTACK = auto()
+    SKIP_TURN = auto()
+    UNKNOWN = auto()
+
+
+# Game action names shared with GameActionProcessor, interned so the
+# dispatch comparisons on the consumer side are identity checks
+ACTION_KEY = sys.intern("action")
+ACTION_ADVANCE_PHASE = sys.intern("advance_phase")
+ACTION_TOGGLE_PAUSE = sys.intern("toggle_pause")
+ACTION_SURVIVOR_ACTION = sys.intern("survivor_action")
+ACTION_TARGET_SELECTION = sys.intern("survivor_target_selection")
+ACTION_MOVE = sys.intern("move")
+ACTION_ATTACK = sys.intern("attack")
+ACTION_SKIP_TURN = sys.intern("skip_turn")
+ACTION_TOGGLE_DEBUG = sys.intern("toggle_debug")
+DIRECTIONS = tuple(sys.intern(name) for name in ("UP", "DOWN", "LEFT", "RIGHT"))
+
+# Shared read-only event payloads, so key presses do not allocate a new dict each time
+_ACTION_PAYLOADS = tuple(MappingProxyType({"action_index": index}) for index in range(3))
+_DIR_PAYLOADS = {
+    direction: MappingProxyType({"direction": direction})
+    for direction in DIRECTIONS
+}
+
+
+@dataclass(slots=True)
 class InputEvent:
     """Represents an input event generated from user input."""
     event_type: InputEventType
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Mapping[str, Any]] = None
     timestamp: int = 0
 
 
@@ -37,14 +65,20 @@ class InputProcessor:
     def __init__(self, config_manager: ConfigurationManager):
         self.config = config_manager
         self._quit_requested = False
+        self.rebuild_key_table()
     
     def process_pygame_events(self) -> List[InputEvent]:
         """Process pygame events and convert to game input events."""
+        return self.process_pygame_events_from(pygame.event.get(), pygame.time.get_ticks())
+    
+    def process_pygame_events_from(self, pygame_events: Iterable[pygame.event.Event],
+                                   current_time: int) -> List[InputEvent]:
+        """Convert already-fetched pygame events to game input events."""
         events = []
-        current_time = pygame.time.get_ticks()
+        convert = self._convert_pygame_event
         
-        for event in pygame.event.get():
-            input_event = self._convert_pygame_event(event, current_time)
+        for event in pygame_events:
+            input_event = convert(event, current_time)
             if input_event:
                 events.append(input_event)
         
@@ -52,69 +86,55 @@ class InputProcessor:
     
     def _convert_pygame_event(self, event: pygame.event.Event, timestamp: int) -> Optional[InputEvent]:
         """Convert a pygame event to an input event."""
-        if event.type == pygame.QUIT:
+        event_type = event.type
+        if event_type == _QUIT:
             self._quit_requested = True
-            return InputEvent(InputEventType.QUIT, timestamp=timestamp)
+            return InputEvent(InputEventType.QUIT, None, timestamp)
         
-        elif event.type == pygame.KEYDOWN:
+        elif event_type == _KEYDOWN:
             return self._handle_keydown(event, timestamp)
         
         # TODO: Add mouse event handling here
         
         return None
     
+    def rebuild_key_table(self):
+        """Rebuild the keycode lookup table from the current key bindings."""
+        key_bindings = self.config.input.key_bindings
+        # In priority order: when two entries share a key, the first one wins
+        entries = [
+            (key_bindings['quit'], InputEventType.QUIT, None),
+            (key_bindings['phase_advance'], InputEventType.PHASE_ADVANCE, None),
+            (key_bindings['pause_toggle'], InputEventType.PAUSE_TOGGLE, None),
+            (key_bindings['action_1'], InputEventType.SURVIVOR_ACTION, _ACTION_PAYLOADS[0]),
+            (key_bindings['action_2'], InputEventType.SURVIVOR_ACTION, _ACTION_PAYLOADS[1]),
+            (key_bindings['action_3'], InputEventType.SURVIVOR_ACTION, _ACTION_PAYLOADS[2]),
+            (_K_F1, InputEventType.DEBUG_TOGGLE, None),
+            # Movement with cursor keys
+            (_K_UP, InputEventType.MOVE, _DIR_PAYLOADS["UP"]),
+            (_K_DOWN, InputEventType.MOVE, _DIR_PAYLOADS["DOWN"]),
+            (_K_LEFT, InputEventType.MOVE, _DIR_PAYLOADS["LEFT"]),
+            (_K_RIGHT, InputEventType.MOVE, _DIR_PAYLOADS["RIGHT"]),
+            # Attack with 'a' key
+            (_K_A, InputEventType.ATTACK, None),
+        ]
+        key_table = {}
+        for key, event_type, data in entries:
+            key_table.setdefault(key, (event_type, data))
+        # The bound get is what _handle_keydown calls per key press
+        self._lookup_key = key_table.get
+    
     def _handle_keydown(self, event: pygame.event.Event, timestamp: int) -> Optional[InputEvent]:
         """Handle keyboard input events."""
         key = event.key
-        key_bindings = self.config.input.key_bindings
+        entry = self._lookup_key(key)
+        if entry is None:
+            return InputEvent(InputEventType.UNKNOWN, {"key": key}, timestamp)
         
-        if key == key_bindings['quit']:
+        event_type, data = entry
+        if event_type is InputEventType.QUIT:
             self._quit_requested = True
-            return InputEvent(InputEventType.QUIT, timestamp=timestamp)
-        
-        elif key == key_bindings['phase_advance']:
-            return InputEvent(InputEventType.PHASE_ADVANCE, timestamp=timestamp)
-        
-        elif key == key_bindings['pause_toggle']:
-            return InputEvent(InputEventType.PAUSE_TOGGLE, timestamp=timestamp)
-        
-        elif key == key_bindings['action_1']:
-            return InputEvent(InputEventType.SURVIVOR_ACTION, 
-                            {"action_index": 0}, timestamp)
-        
-        elif key == key_bindings['action_2']:
-            return InputEvent(InputEventType.SURVIVOR_ACTION, 
-                            {"action_index": 1}, timestamp)
-        
-        elif key == key_bindings['action_3']:
-            return InputEvent(InputEventType.SURVIVOR_ACTION, 
-                            {"action_index": 2}, timestamp)
-        
-        elif key == pygame.K_F1:  # Debug toggle
-            return InputEvent(InputEventType.DEBUG_TOGGLE, timestamp=timestamp)
-        
-        # Movement with cursor keys
-        elif key == pygame.K_UP:
-            return InputEvent(InputEventType.MOVE, {"direction": "UP"}, timestamp)
-        
-        elif key == pygame.K_DOWN:
-            return InputEvent(InputEventType.MOVE, {"direction": "DOWN"}, timestamp)
-        
-        elif key == pygame.K_LEFT:
-            return InputEvent(InputEventType.MOVE, {"direction": "LEFT"}, timestamp)
-        
-        elif key == pygame.K_RIGHT:
-            return InputEvent(InputEventType.MOVE, {"direction": "RIGHT"}, timestamp)
-        
-        # Attack with 'a' key
-        elif key == pygame.K_a:
-            return InputEvent(InputEventType.ATTACK, timestamp=timestamp)
-        
-        # Space key - context sensitive (phase advance OR skip turn)
-        elif key == key_bindings['phase_advance']:  # This is space key
-            return InputEvent(InputEventType.PHASE_ADVANCE, timestamp=timestamp)
-        
-        return InputEvent(InputEventType.UNKNOWN, {"key": key}, timestamp)
+        return InputEvent(event_type, data, timestamp)
     
     def is_quit_requested(self) -> bool:
         """Check if quit was requested."""
@@ -125,74 +145,91 @@ class InputProcessor:
         self._quit_requested = False
 
 
+# Shared read-only results for handlers whose action carries no event data
+_ADVANCE_RESULT: Mapping[str, Any] = MappingProxyType({ACTION_KEY: ACTION_ADVANCE_PHASE})
+_PAUSE_RESULT: Mapping[str, Any] = MappingProxyType({ACTION_KEY: ACTION_TOGGLE_PAUSE})
+_DEBUG_RESULT: Mapping[str, Any] = MappingProxyType({ACTION_KEY: ACTION_TOGGLE_DEBUG})
+_ATTACK_RESULT: Mapping[str, Any] = MappingProxyType({ACTION_KEY: ACTION_ATTACK})
+_SKIP_RESULT: Mapping[str, Any] = MappingProxyType({ACTION_KEY: ACTION_SKIP_TURN})
+
+
+def _handle_phase_advance(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle phase advance request or skip turn during survivor turn."""
+    # During survivor turn, space should skip turn instead of advance phase
+    if game_state.get("waiting_for_action", False):
+        return _SKIP_RESULT
+    else:
+        # This could be phase advance or waiting for phase advance
+        return _ADVANCE_RESULT
+
+
+def _handle_pause_toggle(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle pause toggle."""
+    return _PAUSE_RESULT
+
+
+def _handle_survivor_action(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle survivor action selection."""
+    action_index = event.data.get("action_index", -1) if event.data else -1
+    return {
+        ACTION_KEY: ACTION_SURVIVOR_ACTION,
+        "action_index": action_index
+    }
+
+
+def _handle_debug_toggle(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle debug mode toggle."""
+    return _DEBUG_RESULT
+
+
+def _handle_move(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle movement input."""
+    direction = event.data.get("direction") if event.data else None
+    return {
+        ACTION_KEY: ACTION_MOVE,
+        "direction": direction
+    }
+
+
+def _handle_attack(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle attack input."""
+    return _ATTACK_RESULT
+
+
+def _handle_skip_turn(event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
+    """Handle skip turn input."""
+    return _SKIP_RESULT
+
+
+# Default game event handlers; plain functions, so lookups need no bound-method wrapping
+_EVENT_HANDLERS = {
+    InputEventType.PHASE_ADVANCE: _handle_phase_advance,
+    InputEventType.PAUSE_TOGGLE: _handle_pause_toggle,
+    InputEventType.SURVIVOR_ACTION: _handle_survivor_action,
+    InputEventType.DEBUG_TOGGLE: _handle_debug_toggle,
+    InputEventType.MOVE: _handle_move,
+    InputEventType.ATTACK: _handle_attack,
+    InputEventType.SKIP_TURN: _handle_skip_turn
+}
+
+# Shared read-only result for events that produce no game action
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 class GameEventHandler:
     """Handles game-specific event processing."""
     
     def __init__(self):
+        # Custom handlers registered on this instance, consulted before the defaults
         self.event_handlers = {}
-        self._register_default_handlers()
-    
-    def _register_default_handlers(self):
-        """Register default event handlers."""
-        self.event_handlers[InputEventType.PHASE_ADVANCE] = self._handle_phase_advance
-        self.event_handlers[InputEventType.PAUSE_TOGGLE] = self._handle_pause_toggle
-        self.event_handlers[InputEventType.SURVIVOR_ACTION] = self._handle_survivor_action
-        self.event_handlers[InputEventType.DEBUG_TOGGLE] = self._handle_debug_toggle
-        self.event_handlers[InputEventType.MOVE] = self._handle_move
-        self.event_handlers[InputEventType.ATTACK] = self._handle_attack
-        self.event_handlers[InputEventType.SKIP_TURN] = self._handle_skip_turn
     
-    def handle_event(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_event(self, event: InputEvent, game_state: Dict[str, Any]) -> Mapping[str, Any]:
         """Handle an input event and return resulting game state changes."""
-        handler = self.event_handlers.get(event.event_type)
-        if handler:
+        event_type = event.event_type
+        handler = self.event_handlers.get(event_type) or _EVENT_HANDLERS.get(event_type)
+        if handler is not None:
             return handler(event, game_state)
-        return {}
-    
-    def _handle_phase_advance(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle phase advance request or skip turn during survivor turn."""
-        # During survivor turn, space should skip turn instead of advance phase
-        if game_state.get("waiting_for_action", False):
-            return {"action": "skip_turn"}
-        else:
-            # This could be phase advance or waiting for phase advance
-            return {"action": "advance_phase"}
-    
-    def _handle_pause_toggle(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle pause toggle."""
-        return {"action": "toggle_pause"}
-    
-    def _handle_survivor_action(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle survivor action selection."""
-        action_index = event.data.get("action_index", -1) if event.data else -1
-        return {
-            "action": "survivor_action",
-            "action_index": action_index
-        }
-    
-    def _handle_debug_toggle(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle debug mode toggle."""
-        return {"action": "toggle_debug"}
-    
-    def _handle_move(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle movement input."""
-        direction = event.data.get("direction") if event.data else None
-        return {
-            "action": "move",
-            "direction": direction
-        }
-    
-    def _handle_attack(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle attack input."""
-        return {
-            "action": "attack"
-        }
-    
-    def _handle_skip_turn(self, event: InputEvent, game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle skip turn input."""
-        return {
-            "action": "skip_turn"
-        }
+        return _EMPTY
 
 
 class UIEventHandler:
@@ -201,9 +238,10 @@ class UIEventHandler:
     def handle_ui_events(self, events: List[InputEvent]) -> Dict[str, Any]:
         """Process UI-related events."""
         ui_changes = {}
+        debug_toggle = InputEventType.DEBUG_TOGGLE
         
         for event in events:
-            if event.event_type == InputEventType.DEBUG_TOGGLE:
+            if event.event_type is debug_toggle:
                 ui_changes["toggle_debug_overlay"] = True
         
         return ui_changes
@@ -221,16 +259,27 @@ class InputSystem:
         
         self.events_this_frame: List[InputEvent] = []
     
-    def process_input(self) -> List[InputEvent]:
-        """Process all input and return events generated this frame."""
-        self.events_this_frame = self.processor.process_pygame_events()
-        return self.events_this_frame.copy()
+    def process_input(self, pygame_events: Optional[List[pygame.event.Event]] = None) -> List[InputEvent]:
+        """
+        Process all input and return events generated this frame.
+        
+        Args:
+            pygame_events: Events already fetched from the pygame queue this frame;
+                the queue is read directly when omitted
+        """
+        if pygame_events is None:
+            self.events_this_frame = self.processor.process_pygame_events()
+        else:
+            self.events_this_frame = self.processor.process_pygame_events_from(
+                pygame_events, pygame.time.get_ticks())
+        # A fresh list is built every frame, so it is handed out without copying
+        return self.events_this_frame
     
     def handle_ui_events(self, events: List[InputEvent]) -> Dict[str, Any]:
         """Handle UI-specific events."""
         return self.ui_event_handler.handle_ui_events(events)
     
-    def handle_game_events(self, events: List[InputEvent], game_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def handle_game_events(self, events: List[InputEvent], game_state: Dict[str, Any]) -> List[Mapping[str, Any]]:
         """Handle game-specific events."""
         game_actions = []
         
@@ -260,4 +309,5 @@ class InputSystem:
     def update_key_binding(self, action: str, new_key: int):
         """Update a key binding."""
         if action in self.config.input.key_bindings:
-            self.config.input.key_bindings[action] = new_key
\ No newline at end of file
+            self.config.input.key_bindings[action] = new_key
+            self.processor.rebuild_key_table()
\ No newline at end of file
@@ -4,236 +4,618 @@ Domain-focused rendering architecture with specialized renderers.
 """
 import pygame
 from typing import List, Optional, Dict, Any
-from abc import ABC
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 
 from core.entities import Survivor, Zombie
+from core.game_setup import GameSetup
 from .configuration_manager import ConfigurationManager
 
 
-class BaseRenderer(ABC):
+# Transparent key color for pre-rendered token sprites
+TOKEN_COLORKEY = (255, 0, 255)
+
+# Turn window phase arrow, as (dx, dy) offsets from the arrow's top-left corner
+_ARROW_POINTS = ((0, 4), (12, 9), (0, 14))
+
+
+@lru_cache(maxsize=None)
+def tokens_fitting(zone_pixel_size: int, token_diameter: int, token_radius: int, spacing: int) -> int:
+    """Return how many token columns (or rows) fit inside a zone at the given spacing; shared with GameWindow."""
+    # The k-th token ends at spacing + 2 * radius + k * step from the zone edge
+    step = token_diameter + spacing
+    return max(0, (zone_pixel_size - spacing - 2 * token_radius) // step + 1)
+
+
+@lru_cache(maxsize=256)
+def visible_token_slots(tokens_per_row: int, count: int, fitting: int, first: int, step: int) -> tuple:
+    """
+    Return (index, dx, dy) for each token of a zone group that fits inside the zone.
+    
+    dx and dy are the token centre's offset from the zone's top-left corner, with
+    the first token centred at first and each further column or row step beyond it.
+    Shared with GameWindow so both windows lay tokens out the same way.
+    """
+    columns = min(tokens_per_row, fitting)
+    return tuple((i, first + (i % tokens_per_row) * step, first + (i // tokens_per_row) * step)
+                 for i in range(min(count, tokens_per_row * fitting))
+                 if i % tokens_per_row < columns)
+
+
+def _format_weapon_stats(weapon: str) -> str:
+    """
+    Format a weapon's range/dice/target/damage line, e.g. "[0-1/1/4/1]".
+    
+    Not memoized: GameSetup keeps its own name index in step with the weapons
+    database, and the rendered line is cached by the renderer's text cache.
+    """
+    weapon_data = GameSetup.get_weapon_stats(weapon)
+    if weapon_data:
+        return f"[{weapon_data['range']}/{weapon_data['dice']}/{weapon_data['target']}/{weapon_data['damage']}]"
+    return "[No stats]"
+
+
+@lru_cache(maxsize=None)
+def _wall_offsets(zone_pixel_size: int) -> Dict[str, tuple]:
+    """Wall endpoints relative to a zone's top-left corner, by direction."""
+    zps = zone_pixel_size
+    return {
+        "up": ((0, 0), (zps, 0)),
+        "down": ((0, zps), (zps, zps)),
+        "left": ((0, 0), (0, zps)),
+        "right": ((zps, 0), (zps, zps))
+    }
+
+
+# Door length along the wall, and how far an opened door swings out of it
+DOOR_SIZE = 40
+DOOR_SWING = 20
+
+
+@lru_cache(maxsize=None)
+def _door_offsets(zone_pixel_size: int) -> Dict[str, tuple]:
+    """
+    Door shapes relative to a zone's top-left corner, by direction.
+    
+    Each entry is (closed_rect, (open_start, open_end)): the rect drawn for a
+    closed door and the line drawn for an opened one.
+    """
+    zps = zone_pixel_size
+    mid = (zps - DOOR_SIZE) // 2
+    half = DOOR_SIZE // 2
+    return {
+        "up": ((mid, -3, DOOR_SIZE, 6), ((mid, 0), (mid + half, -DOOR_SWING))),
+        "down": ((mid, zps - 3, DOOR_SIZE, 6), ((mid, zps), (mid + half, zps + DOOR_SWING))),
+        "left": ((-3, mid, 6, DOOR_SIZE), ((0, mid), (-DOOR_SWING, mid + half))),
+        "right": ((zps - 3, mid, 6, DOOR_SIZE), ((zps, mid), (zps + DOOR_SWING, mid + half)))
+    }
+
+
+def _compute_token_positions(groups: Dict[tuple, list], zone_xs: tuple, zone_ys: tuple,
+                             fitting: int, first: int, step: int) -> List[tuple]:
+    """
+    Lay out grouped entity tokens, up to three per row from each zone's top-left corner.
+    
+    Returns (entity, token_x, token_y) centre positions for the tokens that fit in
+    their zone, in group order, so it can be computed apart from any drawing.
+    """
+    positions = []
+    add = positions.append
+    for (row, col), group in groups.items():
+        zone_x = zone_xs[col]
+        zone_y = zone_ys[row]
+        # Tokens that would overflow the zone are never laid out
+        for i, dx, dy in visible_token_slots(min(3, len(group)), len(group), fitting, first, step):
+            add((group[i], zone_x + dx, zone_y + dy))
+    return positions
+
+
+def _group_alive_by_zone(entities) -> Dict[tuple, list]:
+    """Group living entities by their (row, col) zone, keeping their list order."""
+    by_zone = defaultdict(list)
+    for entity in entities:
+        if entity.alive:
+            position = entity.position
+            by_zone[(position.row, position.col)].append(entity)
+    return by_zone
+
+
+def build_zone_draw_list(zones: List[List[Dict[str, Any]]], tile_size: int,
+                         map_start_x: int, map_start_y: int, zone_pixel_size: int) -> List[tuple]:
+    """
+    Lay out a tile's zone grid as a flat list of (x, y, is_building, walls) entries.
+    
+    walls holds (direction, door) pairs for wall connections, with door set to the
+    connection dict when the wall has a door and None otherwise. Shared with
+    GameWindow so both windows draw the map the same way.
+    """
+    draw_list = []
+    for zr in range(tile_size):
+        zone_row = zones[zr]
+        y = map_start_y + zr * zone_pixel_size
+        for zc in range(tile_size):
+            zone = zone_row[zc]
+            walls = tuple(
+                (direction, conn if "door" in conn else None)
+                for direction, conn in zone.get("connections", {}).items()
+                if conn["type"] == "wall"
+            )
+            draw_list.append((map_start_x + zc * zone_pixel_size, y, "building" in zone["features"], walls))
+    return draw_list
+
+
+def build_zone_tiles(zone_pixel_size: int, street_color, building_color, border_color,
+                     like: pygame.Surface) -> tuple:
+    """
+    Return (street, building) zone surfaces, matching like's format, with background and border pre-drawn.
+    
+    Shared with GameWindow so both windows draw the same zone tiles.
+    """
+    tiles = []
+    for color in (street_color, building_color):
+        tile = pygame.Surface((zone_pixel_size, zone_pixel_size), 0, like)
+        tile.fill(color)
+        pygame.draw.rect(tile, border_color, (0, 0, zone_pixel_size, zone_pixel_size), 2)
+        tiles.append(tile)
+    return tuple(tiles)
+
+
+class BaseRenderer:
     """Base class for all specialized renderers."""
     
+    # Maximum number of rendered text surfaces kept per renderer
+    TEXT_CACHE_SIZE = 1024
+    
+    # Palette entries bound as _c_<name> attributes when the renderer is created
+    BOUND_COLORS = ('black', 'white', 'gray', 'dark_gray', 'cyan', 'yellow', 'red', 'blue',
+                    'building_color', 'street_color')
+    
     def __init__(self, screen: pygame.Surface, config_manager: ConfigurationManager):
         self.screen = screen
         self.config = config_manager
+        self._display = config_manager.display
+        self._bind_colors()
+        self._text_cache: OrderedDict = OrderedDict()
+    
+    def _bind_colors(self):
+        """Snapshot the BOUND_COLORS palette entries as _c_<name> attributes."""
+        get_color = self.config.get_color
+        for name in self.BOUND_COLORS:
+            setattr(self, f'_c_{name}', get_color(name))
+    
+    def refresh(self):
+        """Re-read colors and fonts after the configuration changed, dropping anything drawn with the old ones."""
+        self._bind_colors()
+        self._text_cache.clear()
+    
+    def _text_entry(self, font_name: str, text: str, color) -> tuple:
+        """
+        Render antialiased text, reusing earlier identical calls.
+        
+        Returns (surface, half_width, half_height) so callers can centre it without a Rect.
+        """
+        key = (font_name, text, color)
+        cache = self._text_cache
+        entry = cache.get(key)
+        if entry is None:
+            surface = self.config.get_font(font_name).render(text, True, color)
+            width, height = surface.get_size()
+            entry = cache[key] = (surface, width // 2, height // 2)
+            if len(cache) > self.TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return entry
+    
+    def _text(self, font_name: str, text: str, color) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from earlier identical calls."""
+        return self._text_entry(font_name, text, color)[0]
 
 
 class MapRenderer(BaseRenderer):
     """Handles all map-related rendering."""
     
+    def __init__(self, screen: pygame.Surface, config_manager: ConfigurationManager):
+        super().__init__(screen, config_manager)
+        self._zone_list_map: Optional[Dict[str, Any]] = None
+        self._zone_list: List[tuple] = []
+        # Door connection dicts of the current map, in draw order
+        self._door_conns: tuple = ()
+        
+        # Pre-rendered map region, rebuilt when the map or a door state changes
+        self._map_cache: Optional[pygame.Surface] = None
+        self._map_cache_key = None
+        self._map_cache_pos = (0, 0)
+        # Zone size -> (street, building) zone surfaces with the border baked in
+        self._zone_protos: Dict[int, tuple] = {}
+    
+    def refresh(self):
+        """Re-read the configuration and re-bake the map on the next render."""
+        super().refresh()
+        self._zone_protos.clear()
+        self._zone_list_map = None
+        self._map_cache = None
+        self._map_cache_key = None
+    
     def draw_door(self, x: int, y: int, direction: str, opened: bool = False):
         """Draw a door on the wall."""
-        door_size = 40
-        door_color = self.config.get_color('blue')
-        
-        if direction == "up":
-            door_x = x + (self.config.display.zone_pixel_size - door_size) // 2
-            door_y = y
-            if opened:
-                pygame.draw.line(self.screen, door_color,
-                               (door_x, door_y), (door_x + door_size//2, door_y - 20), 3)
-            else:
-                pygame.draw.rect(self.screen, door_color,
-                               (door_x, door_y - 3, door_size, 6))
-        elif direction == "down":
-            door_x = x + (self.config.display.zone_pixel_size - door_size) // 2
-            door_y = y + self.config.display.zone_pixel_size
-            if opened:
-                pygame.draw.line(self.screen, door_color,
-                               (door_x, door_y), (door_x + door_size//2, door_y + 20), 3)
-            else:
-                pygame.draw.rect(self.screen, door_color,
-                               (door_x, door_y - 3, door_size, 6))
-        elif direction == "left":
-            door_x = x
-            door_y = y + (self.config.display.zone_pixel_size - door_size) // 2
-            if opened:
-                pygame.draw.line(self.screen, door_color,
-                               (door_x, door_y), (door_x - 20, door_y + door_size//2), 3)
-            else:
-                pygame.draw.rect(self.screen, door_color,
-                               (door_x - 3, door_y, 6, door_size))
-        elif direction == "right":
-            door_x = x + self.config.display.zone_pixel_size
-            door_y = y + (self.config.display.zone_pixel_size - door_size) // 2
-            if opened:
-                pygame.draw.line(self.screen, door_color,
-                               (door_x, door_y), (door_x + 20, door_y + door_size//2), 3)
-            else:
-                pygame.draw.rect(self.screen, door_color,
-                               (door_x - 3, door_y, 6, door_size))
+        shapes = _door_offsets(self._display.zone_pixel_size).get(direction)
+        if shapes is None:
+            return
+        
+        closed_rect, (start, end) = shapes
+        if opened:
+            # Opened doors are drawn as an angled line
+            pygame.draw.line(self.screen, self._c_blue,
+                           (x + start[0], y + start[1]), (x + end[0], y + end[1]), 3)
+        else:
+            dx, dy, width, height = closed_rect
+            pygame.draw.rect(self.screen, self._c_blue, (x + dx, y + dy, width, height))
 
     def draw_wall(self, x: int, y: int, direction: str):
         """Draw a wall in the specified direction."""
-        wall_color = self.config.get_color('black')
-        wall_width = self.config.display.wall_width
-        zone_size = self.config.display.zone_pixel_size
-        
-        if direction == "up":
-            pygame.draw.line(self.screen, wall_color,
-                           (x, y), (x + zone_size, y), wall_width)
-        elif direction == "down":
-            pygame.draw.line(self.screen, wall_color,
-                           (x, y + zone_size), (x + zone_size, y + zone_size), wall_width)
-        elif direction == "left":
-            pygame.draw.line(self.screen, wall_color,
-                           (x, y), (x, y + zone_size), wall_width)
-        elif direction == "right":
-            pygame.draw.line(self.screen, wall_color,
-                           (x + zone_size, y), (x + zone_size, y + zone_size), wall_width)
+        ends = _wall_offsets(self._display.zone_pixel_size).get(direction)
+        if ends:
+            (x1, y1), (x2, y2) = ends
+            pygame.draw.line(self.screen, self._c_black,
+                           (x + x1, y + y1), (x + x2, y + y2), self._display.wall_width)
+
+    def _zone_draw_list(self, map_data: Dict[str, Any]) -> List[tuple]:
+        """
+        Flatten the map's zones into (x, y, is_building, walls) entries.
+        
+        walls holds (direction, door) pairs where door is the connection dict for
+        doors (so the opened flag is read live) and None for plain walls. The list
+        is rebuilt only when a different map is rendered.
+        """
+        if map_data is self._zone_list_map:
+            return self._zone_list
+        
+        display = self._display
+        draw_list = build_zone_draw_list(map_data["tiles"][0][0]["zones"], display.tile_size,
+                                         display.map_start_x, display.map_start_y,
+                                         display.zone_pixel_size)
+        
+        self._zone_list_map = map_data
+        self._zone_list = draw_list
+        self._door_conns = tuple(door for _, _, _, walls in draw_list
+                                 for _, door in walls if door is not None)
+        return draw_list
+
+    # Room around the zone grid for walls and opened doors that stick out of it
+    MAP_CACHE_MARGIN = 24
+
+    def _zone_prototypes(self, zps: int) -> tuple:
+        """Return (street, building) zone surfaces with background and border pre-drawn."""
+        protos = self._zone_protos.get(zps)
+        if protos is None:
+            protos = self._zone_protos[zps] = build_zone_tiles(
+                zps, self._c_street_color, self._c_building_color, self._c_black, self.screen)
+        return protos
+
+    def _draw_zones(self, draw_list: List[tuple], offset_x: int, offset_y: int):
+        """
+        Draw zone backgrounds, walls and doors shifted by the given offset.
+        
+        Zones are drawn strictly in order: each zone's background covers the part of
+        earlier zones' walls and doors that reaches into it, so walls cannot be merged
+        across zones without changing the picture.
+        """
+        zps = self._display.zone_pixel_size
+        wall_width = self._display.wall_width
+        black = self._c_black
+        zone_protos = self._zone_prototypes(zps)
+        screen = self.screen
+        blit = screen.blit
+        draw_line = pygame.draw.line
+        draw_door = self.draw_door
+        wall_offsets = _wall_offsets(zps)
+
+        for x, y, is_building, walls in draw_list:
+            x -= offset_x
+            y -= offset_y
+            blit(zone_protos[is_building], (x, y))
+            
+            for direction, door in walls:
+                ends = wall_offsets.get(direction)
+                if ends:
+                    (x1, y1), (x2, y2) = ends
+                    draw_line(screen, black, (x + x1, y + y1), (x + x2, y + y2), wall_width)
+                if door is not None:
+                    draw_door(x, y, direction, door.get("opened", False))
+
+    def _build_map_cache(self, draw_list: List[tuple]):
+        """Render the map region once into an off-screen surface."""
+        display = self._display
+        margin = self.MAP_CACHE_MARGIN
+        size = display.tile_size * display.zone_pixel_size + 2 * margin
+        pos = (display.map_start_x - margin, display.map_start_y - margin)
+        
+        cache = pygame.Surface((size, size), 0, self.screen)
+        # The map is drawn over the cleared screen, so the margin uses the clear color
+        cache.fill(self._c_black)
+        
+        screen = self.screen
+        self.screen = cache
+        try:
+            self._draw_zones(draw_list, pos[0], pos[1])
+        finally:
+            self.screen = screen
+        
+        self._map_cache = cache
+        self._map_cache_pos = pos
+
+    def state_key(self, map_data: Dict[str, Any]) -> Optional[tuple]:
+        """Build a key covering everything render draws for this map."""
+        if not map_data:
+            return None
+        draw_list = self._zone_draw_list(map_data)
+        # Opening or closing a door changes the key and re-bakes the map
+        return (id(draw_list), tuple([door.get("opened", False) for door in self._door_conns]))
 
     def render(self, map_data: Dict[str, Any]):
         """Render the game map."""
         if not map_data:
             return
-            
-        tile = map_data["tiles"][0][0]
-        zones = tile["zones"]
-
-        for zr in range(self.config.display.tile_size):
-            for zc in range(self.config.display.tile_size):
-                zone = zones[zr][zc]
-                
-                x = self.config.display.map_start_x + zc * self.config.display.zone_pixel_size
-                y = self.config.display.map_start_y + zr * self.config.display.zone_pixel_size
-
-                color = (self.config.get_color('building_color') if "building" in zone["features"] 
-                        else self.config.get_color('street_color'))
-
-                pygame.draw.rect(self.screen, color, 
-                               (x, y, self.config.display.zone_pixel_size, self.config.display.zone_pixel_size))
-                
-                pygame.draw.rect(self.screen, self.config.get_color('black'),
-                               (x, y, self.config.display.zone_pixel_size, self.config.display.zone_pixel_size), 2)
-                
-                conns = zone.get("connections", {})
-                for direction, conn in conns.items():
-                    if conn["type"] == "wall":
-                        self.draw_wall(x, y, direction)
-                        if "door" in conn:
-                            opened = conn.get("opened", False)
-                            self.draw_door(x, y, direction, opened)
+        
+        draw_list = self._zone_draw_list(map_data)
+        cache_key = self.state_key(map_data)
+        if self._map_cache is None or cache_key != self._map_cache_key:
+            self._build_map_cache(draw_list)
+            self._map_cache_key = cache_key
+        
+        self.screen.blit(self._map_cache, self._map_cache_pos)
 
 
 class EntityRenderer(BaseRenderer):
     """Handles rendering of game entities (survivors, zombies)."""
     
+    def __init__(self, screen: pygame.Surface, config_manager: ConfigurationManager):
+        super().__init__(screen, config_manager)
+        # Zone column -> left x and zone row -> top y, for the geometry they were built for
+        self._zone_x: tuple = ()
+        self._zone_y: tuple = ()
+        self._zone_origin_key = None
+        # Token spacing -> (layout key, token positions) of the last layout at that spacing
+        self._layouts: Dict[int, tuple] = {}
+        
+        # Token discs with their border baked in, blitted centred on each token
+        self._token_surfaces = self._build_token_surfaces()
+    
+    def refresh(self):
+        """Re-read the configuration and rebuild the token sprites."""
+        super().refresh()
+        self._token_surfaces = self._build_token_surfaces()
+    
+    def _build_token_surfaces(self) -> Dict[str, pygame.Surface]:
+        """Pre-render the sprite for each kind of token."""
+        token_surfaces = {
+            'current': self._build_token_surface(self._c_cyan),
+            'alive': self._build_token_surface(self._c_white),
+            'dead': self._build_token_surface(self._c_gray),
+            'zombie': self._build_token_surface(self._c_dark_gray)
+        }
+        # Every zombie token shows the same glyph, so it is baked into the zombie sprite
+        z_surface = self.config.get_font('medium').render('Z', True, self._c_white)
+        center = self._display.token_radius + 1
+        token_surfaces['zombie'].blit(
+            z_surface, (center - z_surface.get_width() // 2, center - z_surface.get_height() // 2))
+        return token_surfaces
+    
+    def _build_token_surface(self, fill_color) -> pygame.Surface:
+        """Pre-render a filled token disc with its black border."""
+        display = self._display
+        radius = display.token_radius
+        # One spare pixel on each side keeps the disc clear of the surface edge
+        center = radius + 1
+        size = 2 * center + 1
+        
+        token = pygame.Surface((size, size))
+        token.fill(TOKEN_COLORKEY)
+        token.set_colorkey(TOKEN_COLORKEY)
+        pygame.draw.circle(token, fill_color, (center, center), radius)
+        pygame.draw.circle(token, self._c_black, (center, center),
+                           radius, display.token_border_width)
+        return token
+    
+    def _zone_origins(self) -> tuple:
+        """Return the (zone_x, zone_y) lookup tables, rebuilt if the map geometry changed."""
+        display = self._display
+        key = (display.map_start_x, display.map_start_y, display.zone_pixel_size, display.tile_size)
+        if key != self._zone_origin_key:
+            msx, msy, zps, tile_size = key
+            self._zone_x = tuple(msx + c * zps for c in range(tile_size))
+            self._zone_y = tuple(msy + r * zps for r in range(tile_size))
+            self._zone_origin_key = key
+        return self._zone_x, self._zone_y
+    
+    @staticmethod
+    def state_key(survivors: List[Survivor], zombies: List[Zombie], current_survivor: Optional[Survivor] = None) -> tuple:
+        """Build a key covering everything render_survivors and render_zombies draw."""
+        survivor_key = None
+        if survivors:
+            survivor_key = (tuple([(s.id, s.alive, s.position.row, s.position.col) for s in survivors]),
+                            current_survivor.id if current_survivor else None)
+        zombie_key = None
+        if zombies:
+            zombie_key = tuple([(z.alive, z.position.row, z.position.col) for z in zombies])
+        return survivor_key, zombie_key
+    
+    def _token_positions(self, entities: list, spacing: int) -> List[tuple]:
+        """
+        Group living entities by zone and lay out their tokens at the given spacing.
+        
+        The layout is kept per spacing and reused until an entity moves, dies or
+        the roster changes, e.g. across door toggles or a new current survivor.
+        """
+        display = self._display
+        diameter = display.token_diameter
+        radius = display.token_radius
+        zone_xs, zone_ys = self._zone_origins()
+        # Flat snapshot of everything the layout depends on, taken in one pass
+        layout_key = (zone_xs, zone_ys, display.zone_pixel_size, diameter, radius,
+                      tuple([(id(e), e.alive, e.position.row, e.position.col) for e in entities]))
+        cached = self._layouts.get(spacing)
+        if cached is not None and cached[0] == layout_key:
+            return cached[1]
+        
+        positions = _compute_token_positions(
+            _group_alive_by_zone(entities), zone_xs, zone_ys,
+            tokens_fitting(display.zone_pixel_size, diameter, radius, spacing),
+            spacing + radius, diameter + spacing
+        )
+        self._layouts[spacing] = (layout_key, positions)
+        return positions
+    
     def render_survivors(self, survivors: List[Survivor], current_survivor: Optional[Survivor] = None):
         """Render survivor tokens."""
         if not survivors:
             return
         
-        survivors_by_position = {}
-        for survivor in survivors:
-            if survivor.alive:
-                pos_key = (survivor.position.row, survivor.position.col)
-                if pos_key not in survivors_by_position:
-                    survivors_by_position[pos_key] = []
-                survivors_by_position[pos_key].append(survivor)
-        
-        for (row, col), survivor_group in survivors_by_position.items():
-            zone_x = self.config.display.map_start_x + col * self.config.display.zone_pixel_size
-            zone_y = self.config.display.map_start_y + row * self.config.display.zone_pixel_size
+        sprite_offset = self._display.token_radius + 1
+        current_token = self._token_surfaces['current']
+        alive_token = self._token_surfaces['alive']
+        dead_token = self._token_surfaces['dead']
+        black = self._c_black
+        text_entry = self._text_entry
+        blit_sequence = []
+        add_blit = blit_sequence.append
+        
+        for survivor, token_x, token_y in self._token_positions(survivors, 10):
+            token = (current_token if current_survivor and survivor.id == current_survivor.id 
+                    else alive_token if survivor.alive else dead_token)
             
-            tokens_per_row = min(3, len(survivor_group))
-            spacing = 10
-            start_x = zone_x + spacing
-            start_y = zone_y + spacing
+            add_blit((token, (token_x - sprite_offset, token_y - sprite_offset)))
             
-            for i, survivor in enumerate(survivor_group):
-                token_row = i // tokens_per_row
-                token_col = i % tokens_per_row
-                
-                token_x = start_x + token_col * (self.config.display.token_diameter + spacing) + self.config.display.token_radius
-                token_y = start_y + token_row * (self.config.display.token_diameter + spacing) + self.config.display.token_radius
-                
-                if (token_x + self.config.display.token_radius > zone_x + self.config.display.zone_pixel_size or 
-                    token_y + self.config.display.token_radius > zone_y + self.config.display.zone_pixel_size):
-                    continue
-                
-                color = (self.config.get_color('cyan') if current_survivor and survivor.id == current_survivor.id 
-                        else self.config.get_color('white') if survivor.alive else self.config.get_color('gray'))
-                
-                pygame.draw.circle(self.screen, color, (token_x, token_y), self.config.display.token_radius)
-                pygame.draw.circle(self.screen, self.config.get_color('black'), (token_x, token_y), 
-                                 self.config.display.token_radius, self.config.display.token_border_width)
-                
-                name_surface = self.config.get_font('small').render(survivor.name, True, self.config.get_color('black'))
-                name_rect = name_surface.get_rect(center=(token_x, token_y))
-                self.screen.blit(name_surface, name_rect)
+            name_surface, half_w, half_h = text_entry('small', survivor.name, black)
+            add_blit((name_surface, (token_x - half_w, token_y - half_h)))
+        
+        # Tokens and names stay interleaved so later tokens still cover earlier names
+        self.screen.blits(blit_sequence, False)
     
     def render_zombies(self, zombies: List[Zombie]):
         """Render zombie tokens."""
         if not zombies:
             return
         
-        zombies_by_position = {}
-        for zombie in zombies:
-            if zombie.alive:
-                pos_key = (zombie.position.row, zombie.position.col)
-                if pos_key not in zombies_by_position:
-                    zombies_by_position[pos_key] = []
-                zombies_by_position[pos_key].append(zombie)
-        
-        for (row, col), zombie_group in zombies_by_position.items():
-            zone_x = self.config.display.map_start_x + col * self.config.display.zone_pixel_size
-            zone_y = self.config.display.map_start_y + row * self.config.display.zone_pixel_size
-            
-            tokens_per_row = min(3, len(zombie_group))
-            spacing = 20
-            start_x = zone_x + spacing
-            start_y = zone_y + spacing
-            
-            for i, zombie in enumerate(zombie_group):
-                token_row = i // tokens_per_row
-                token_col = i % tokens_per_row
-                
-                token_x = start_x + token_col * (self.config.display.token_diameter + spacing) + self.config.display.token_radius
-                token_y = start_y + token_row * (self.config.display.token_diameter + spacing) + self.config.display.token_radius
-                
-                if (token_x + self.config.display.token_radius > zone_x + self.config.display.zone_pixel_size or 
-                    token_y + self.config.display.token_radius > zone_y + self.config.display.zone_pixel_size):
-                    continue
-                
-                pygame.draw.circle(self.screen, self.config.get_color('dark_gray'), (token_x, token_y), self.config.display.token_radius)
-                pygame.draw.circle(self.screen, self.config.get_color('black'), (token_x, token_y), 
-                                 self.config.display.token_radius, self.config.display.token_border_width)
-                
-                z_surface = self.config.get_font('medium').render('Z', True, self.config.get_color('white'))
-                z_rect = z_surface.get_rect(center=(token_x, token_y))
-                self.screen.blit(z_surface, z_rect)
+        sprite_offset = self._display.token_radius + 1
+        zombie_token = self._token_surfaces['zombie']
+        self.screen.blits([(zombie_token, (token_x - sprite_offset, token_y - sprite_offset))
+                           for _, token_x, token_y in self._token_positions(zombies, 20)], False)
 
 
 class UIRenderer(BaseRenderer):
     """Handles UI elements rendering (menus, HUD, cards)."""
     
+    # Turn control window geometry
+    INFO_WIDTH = 220  # Narrower to avoid overlapping survivor cards
+    INFO_BASE_HEIGHT = 200  # Smaller height to be more compact
+    INFO_Y = 10
+    
+    def __init__(self, screen: pygame.Surface, config_manager: ConfigurationManager):
+        super().__init__(screen, config_manager)
+        # Rendered turn control window, reused while its content key is unchanged
+        self._turn_info_cache_key = None
+        self._turn_info_surface: Optional[pygame.Surface] = None
+        self._turn_info_area: Optional[pygame.Rect] = None
+        # (text, max_width) -> wrapped lines
+        self._wrap_cache: Dict[tuple, List[str]] = {}
+        # Survivor name -> (rendered card, signature it was rendered for)
+        self._card_cache: Dict[str, tuple] = {}
+        # (name, level, border, background and text colors) -> pre-drawn card chrome
+        self._card_chrome: Dict[tuple, pygame.Surface] = {}
+        # Scratch geometry reused by every turn window redraw
+        self._info_rect = pygame.Rect(0, 0, 0, 0)
+        self._arrow_buf = [[0, 0] for _ in _ARROW_POINTS]
+    
+    def refresh(self):
+        """Re-read the configuration and redraw the turn window and cards on the next render."""
+        super().refresh()
+        self._turn_info_cache_key = None
+        self._turn_info_surface = None
+        self._wrap_cache.clear()
+        self._card_cache.clear()
+        self._card_chrome.clear()
+    
+    @staticmethod
+    def turn_info_key(turn_info: Dict[str, Any], current_survivor, available_actions, survivors, combat_info) -> tuple:
+        """Build a key covering everything the turn control window displays."""
+        turn_order_info = turn_info.get('turn_order_info') or {}
+        turn_order = turn_order_info.get('turn_order')
+        combat_key = None
+        if combat_info and combat_info.get('waiting_for_selection', False):
+            combat_key = (combat_info.get('message', 'Combat!'),
+                          tuple((s.name, s.wounds) for s in combat_info.get('target_survivors', [])))
+        return (
+            turn_info['turn_number'],
+            turn_info.get('phase_name', ''),
+            turn_info.get('phase_complete', False),
+            tuple(turn_order) if turn_order is not None else None,
+            turn_order_info.get('first_player'),
+            current_survivor.name if current_survivor else None,
+            tuple(available_actions) if available_actions else None,
+            tuple((s.name, s.alive, s.actions_remaining) for s in survivors) if survivors else None,
+            combat_key
+        )
+    
     def render_turn_info(self, turn_info: Dict[str, Any], current_survivor=None, available_actions=None, survivors=None, combat_info=None):
         """Render revamped turn control window in upper right corner."""
+        info_x = self._display.window_width - self.INFO_WIDTH - 15  # More margin from right edge
+        panel_x = info_x - 5
+        panel_y = self.INFO_Y - 5
+        
+        key = self.turn_info_key(turn_info, current_survivor, available_actions, survivors, combat_info)
+        if key != self._turn_info_cache_key or self._turn_info_surface is None:
+            # Text may run past the box, so the cache spans down and right to the window edge
+            size = (self._display.window_width - panel_x,
+                    self._display.window_height - panel_y)
+            surface = self._turn_info_surface
+            if surface is None or surface.get_size() != size:
+                surface = pygame.Surface(size, 0, self.screen)
+            # The window is drawn over the cleared screen, so unused space uses the clear color
+            surface.fill(self._c_black)
+            
+            screen = self.screen
+            self.screen = surface
+            try:
+                content_bottom = self._draw_turn_info(info_x - panel_x, self.INFO_Y - panel_y, turn_info,
+                                                      current_survivor, available_actions, survivors, combat_info)
+            finally:
+                self.screen = screen
+            
+            self._turn_info_surface = surface
+            self._turn_info_area = pygame.Rect(0, 0, size[0], min(size[1], max(self.INFO_BASE_HEIGHT, content_bottom)))
+            self._turn_info_cache_key = key
+        
+        self.screen.blit(self._turn_info_surface, (panel_x, panel_y), self._turn_info_area)
+    
+    def _draw_turn_info(self, info_x: int, info_y: int, turn_info: Dict[str, Any], current_survivor=None,
+                        available_actions=None, survivors=None, combat_info=None) -> int:
+        """Draw the turn control window at the given position and return the y below its content."""
         # Calculate dynamic height based on content (survivors + phases + controls)
-        info_width = 220  # Narrower to avoid overlapping survivor cards
-        base_height = 200  # Smaller height to be more compact
-        info_x = self.config.display.window_width - info_width - 15  # More margin from right edge
-        info_y = 10
+        info_width = self.INFO_WIDTH
+        base_height = self.INFO_BASE_HEIGHT
         line_height = 16  # Smaller line height for compactness
         
         # Background
-        info_rect = pygame.Rect(info_x - 5, info_y - 5, info_width, base_height)
-        pygame.draw.rect(self.screen, (0, 0, 0, 180), info_rect)
-        pygame.draw.rect(self.screen, self.config.get_color('white'), info_rect, 2)
+        info_rect = self._info_rect
+        info_rect.update(info_x - 5, info_y - 5, info_width, base_height)
+        self.screen.fill(self._c_black, info_rect)
+        pygame.draw.rect(self.screen, self._c_white, info_rect, 2)
         
         current_y = info_y + 5
         
         # 1. Turn number at the top (smaller font for compact window)
         turn_text = f"Turn {turn_info['turn_number']}"
-        turn_surface = self.config.get_font('large').render(turn_text, True, self.config.get_color('white'))
-        turn_rect = turn_surface.get_rect(centerx=info_x + info_width//2, y=current_y)
-        self.screen.blit(turn_surface, turn_rect)
+        turn_surface, turn_half_w, _ = self._text_entry('large', turn_text, self._c_white)
+        self.screen.blit(turn_surface, (info_x + info_width//2 - turn_half_w, current_y))
         current_y += 28
         
         # 2. Phase list structure
         current_phase = turn_info.get('phase_name', '')
         
         # Helper function to draw arrow and text
+        arrow_buf = self._arrow_buf
         def draw_phase_item(text, is_current, y_pos, indent=0):
             arrow_x = info_x + 10 + indent
             text_x = arrow_x + 20
@@ -241,16 +623,14 @@ class UIRenderer(BaseRenderer):
             # Draw yellow arrow if current phase
             if is_current:
                 # Yellow arrow pointing right (triangle)
-                arrow_points = [
-                    (arrow_x, y_pos + 4),
-                    (arrow_x + 12, y_pos + 9),
-                    (arrow_x, y_pos + 14)
-                ]
-                pygame.draw.polygon(self.screen, self.config.get_color('yellow'), arrow_points)
+                for point, (dx, dy) in zip(arrow_buf, _ARROW_POINTS):
+                    point[0] = arrow_x + dx
+                    point[1] = y_pos + dy
+                pygame.draw.polygon(self.screen, self._c_yellow, arrow_buf)
             
             # Draw text (smaller font for compact window)
-            color = self.config.get_color('white') if is_current else (180, 180, 180)
-            text_surface = self.config.get_font('medium').render(text, True, color)
+            color = self._c_white if is_current else (180, 180, 180)
+            text_surface = self._text('medium', text, color)
             self.screen.blit(text_surface, (text_x, y_pos))
             
             return y_pos + line_height + 1
@@ -266,14 +646,16 @@ class UIRenderer(BaseRenderer):
             if turn_order_info and 'turn_order' in turn_order_info:
                 # Display survivors in turn order with position indicators
                 turn_order_names = turn_order_info['turn_order']
+                first_player = turn_order_info.get('first_player')
+                # Living survivors by name; built in reverse so the first match wins
+                alive_by_name = {s.name: s for s in reversed(survivors) if s.alive}
                 for i, survivor_name in enumerate(turn_order_names):
                     # Find the survivor entity
-                    survivor = next((s for s in survivors if s.name == survivor_name and s.alive), None)
+                    survivor = alive_by_name.get(survivor_name)
                     if survivor:
                         # Format: "1. Eva (3/3)" showing position, name, and actions
-                        position_marker = f"{i+1}. " if turn_order_info.get('first_player') == survivor_name else f"{i+1}. "
-                        if turn_order_info.get('first_player') == survivor_name:
-                            position_marker = f"👑{i+1}. "  # Crown for first player
+                        # Crown for first player
+                        position_marker = f"👑{i+1}. " if survivor_name == first_player else f"{i+1}. "
                         
                         survivor_text = f"{position_marker}{survivor.name} ({survivor.actions_remaining}/3)"
                         is_current_survivor = (current_survivor and 
@@ -309,33 +691,33 @@ class UIRenderer(BaseRenderer):
         # Show available actions for current survivor OR phase completion message
         if current_survivor and available_actions and is_survivor_turn:
             # Separator line
-            pygame.draw.line(self.screen, self.config.get_color('white'), 
+            pygame.draw.line(self.screen, self._c_white, 
                            (info_x + 5, current_y), (info_x + info_width - 15, current_y), 1)
             current_y += 15
             
             # Actions header
             actions_text = "Available Actions:"
-            actions_surface = self.config.get_font('small').render(actions_text, True, self.config.get_color('cyan'))
+            actions_surface = self._text('small', actions_text, self._c_cyan)
             self.screen.blit(actions_surface, (info_x + 10, current_y))
             current_y += 18
             
             # List actions
             for i, action in enumerate(available_actions):
                 action_text = f"{i+1}. {action}"
-                action_surface = self.config.get_font('small').render(action_text, True, self.config.get_color('white'))
+                action_surface = self._text('small', action_text, self._c_white)
                 self.screen.blit(action_surface, (info_x + 15, current_y))
                 current_y += 16
         
         elif combat_info and combat_info.get('waiting_for_selection', False):
             # Show combat survivor selection UI
             # Separator line
-            pygame.draw.line(self.screen, self.config.get_color('white'), 
+            pygame.draw.line(self.screen, self._c_white, 
                            (info_x + 5, current_y), (info_x + info_width - 15, current_y), 1)
             current_y += 15
             
             # Combat message
             combat_message = combat_info.get('message', 'Combat!')
-            combat_surface = self.config.get_font('small').render(combat_message, True, self.config.get_color('red'))
+            combat_surface = self._text('small', combat_message, self._c_red)
             self.screen.blit(combat_surface, (info_x + 10, current_y))
             current_y += 18
             
@@ -343,30 +725,32 @@ class UIRenderer(BaseRenderer):
             target_survivors = combat_info.get('target_survivors', [])
             for i, survivor in enumerate(target_survivors):
                 survivor_text = f"{i+1}. {survivor.name} ({survivor.wounds}/2)"
-                survivor_color = self.config.get_color('white')
+                survivor_color = self._c_white
                 if survivor.wounds >= 1:
-                    survivor_color = self.config.get_color('yellow')  # Wounded survivors in yellow
-                survivor_surface = self.config.get_font('small').render(survivor_text, True, survivor_color)
+                    survivor_color = self._c_yellow  # Wounded survivors in yellow
+                survivor_surface = self._text('small', survivor_text, survivor_color)
                 self.screen.blit(survivor_surface, (info_x + 15, current_y))
                 current_y += 16
         
         elif turn_info.get('phase_complete', False):
             # Show phase completion message when phase is done
             # Separator line
-            pygame.draw.line(self.screen, self.config.get_color('white'), 
+            pygame.draw.line(self.screen, self._c_white, 
                            (info_x + 5, current_y), (info_x + info_width - 15, current_y), 1)
             current_y += 15
             
             # Phase completion message
             completion_text = "Press Space to move"
-            completion_surface = self.config.get_font('small').render(completion_text, True, self.config.get_color('yellow'))
+            completion_surface = self._text('small', completion_text, self._c_yellow)
             self.screen.blit(completion_surface, (info_x + 10, current_y))
             current_y += 16
             
             next_phase_text = "to next phase"
-            next_phase_surface = self.config.get_font('small').render(next_phase_text, True, self.config.get_color('yellow'))
+            next_phase_surface = self._text('small', next_phase_text, self._c_yellow)
             self.screen.blit(next_phase_surface, (info_x + 10, current_y))
             current_y += 16
+        
+        return current_y
     
 
     def render_survivor_cards(self, survivors_data: List[Dict[str, Any]], survivors: List[Survivor], 
@@ -375,68 +759,154 @@ class UIRenderer(BaseRenderer):
         if not survivors_data:
             return
         
+        for card in self._card_layout(survivors_data, survivors, current_survivor):
+            self._render_single_survivor_card(*card)
+    
+    def survivor_cards_key(self, survivors_data: List[Dict[str, Any]], survivors: List[Survivor],
+                           current_survivor: Optional[Survivor] = None) -> Optional[tuple]:
+        """Build a key covering everything render_survivor_cards displays."""
+        if not survivors_data:
+            return None
+        return tuple((survivor_data['name'], self._card_signature(card_y, survivor_data, survivor_entity, is_active))
+                     for _, card_y, survivor_data, survivor_entity, is_active
+                     in self._card_layout(survivors_data, survivors, current_survivor))
+    
+    def _card_layout(self, survivors_data: List[Dict[str, Any]], survivors: List[Survivor],
+                     current_survivor: Optional[Survivor]):
+        """Yield (card_x, card_y, survivor_data, survivor_entity, is_active) for each card."""
+        by_name = self._survivors_by_name(survivors)
+        
         for i, survivor_data in enumerate(survivors_data):
-            survivor_entity = None
-            for survivor in survivors:
-                if survivor.name == survivor_data['name']:
-                    survivor_entity = survivor
-                    break
+            survivor_entity = by_name.get(survivor_data['name'])
             
-            card_x = self.config.display.card_start_x
-            card_y = 50 + (i * (self.config.display.card_height + self.config.display.card_spacing))
+            card_x = self._display.card_start_x
+            card_y = 50 + (i * (self._display.card_height + self._display.card_spacing))
             
             is_active = (current_survivor and survivor_entity and 
                         current_survivor.id == survivor_entity.id)
             
-            self._render_single_survivor_card(card_x, card_y, survivor_data, survivor_entity, is_active)
+            yield card_x, card_y, survivor_data, survivor_entity, is_active
+    
+    @staticmethod
+    def _survivors_by_name(survivors: List[Survivor]) -> Dict[str, Survivor]:
+        """Map survivor names to entities; the roster is small enough to rebuild every call."""
+        # Built in reverse so the first survivor with a given name wins
+        return {survivor.name: survivor for survivor in reversed(survivors)}
+    
+    @staticmethod
+    def _card_signature(card_y: int, survivor_data: Dict[str, Any],
+                        survivor_entity: Optional[Survivor], is_active: bool) -> tuple:
+        """Everything a survivor card shows; the last item is whether the survivor is dead."""
+        # Check if survivor is dead
+        is_dead = (survivor_entity and not survivor_entity.alive) or survivor_data.get('wounds', 0) >= 2
+        
+        return (
+            card_y,
+            survivor_data['level'],
+            survivor_data['exp'],
+            survivor_data['wounds'],
+            tuple(survivor_data.get('equipment', {}).items()),
+            tuple(survivor_data.get('skills', {}).items()),
+            survivor_entity.actions_remaining if survivor_entity else None,
+            bool(is_active),
+            bool(is_dead)
+        )
     
     def _render_single_survivor_card(self, card_x: int, card_y: int, survivor_data: Dict[str, Any], 
                                    survivor_entity: Optional[Survivor], is_active: bool):
         """Render a single survivor card with all details."""
-        # Check if survivor is dead
-        is_dead = (survivor_entity and not survivor_entity.alive) or survivor_data.get('wounds', 0) >= 2
+        # The cached surface is reused while the signature matches
+        signature = self._card_signature(card_y, survivor_data, survivor_entity, is_active)
+        is_dead = signature[-1]
+        name = survivor_data['name']
+        cached = self._card_cache.get(name)
+        if cached is None or cached[1] != signature:
+            cached = self._card_cache[name] = (
+                self._build_card_surface(card_y, survivor_data, survivor_entity, is_active, is_dead),
+                signature
+            )
+        self.screen.blit(cached[0], (card_x, card_y))
+    
+    def _build_card_surface(self, card_y: int, survivor_data: Dict[str, Any],
+                            survivor_entity: Optional[Survivor], is_active: bool, is_dead: bool) -> pygame.Surface:
+        """Draw a survivor card off-screen and return it, including any text running below the card."""
+        display = self._display
+        # Long skill lists can run past the card bottom, so draw down to the window edge first
+        scratch_height = max(display.card_height, display.window_height - card_y, 1)
+        scratch = pygame.Surface((display.card_width, scratch_height), 0, self.screen)
+        # Cards are drawn over the cleared screen, so unused space uses the clear color
+        scratch.fill(self._c_black)
+        
+        screen = self.screen
+        self.screen = scratch
+        try:
+            content_bottom = self._draw_survivor_card(0, 0, card_y, survivor_data, survivor_entity, is_active, is_dead)
+        finally:
+            self.screen = screen
+        
+        used_height = min(scratch_height, max(display.card_height, content_bottom))
+        return scratch.subsurface((0, 0, display.card_width, used_height)).copy()
+    
+    def _build_card_chrome(self, name: str, level: str, border_color, border_width: int,
+                           card_bg_color, text_color) -> pygame.Surface:
+        """Draw the static part of a survivor card: border, background, name and level circle."""
+        display = self._display
+        chrome = pygame.Surface((display.card_width, display.card_height), 0, self.screen)
+        chrome.fill(self._c_black)
+        
+        pygame.draw.rect(chrome, border_color, 
+                       (0, 0, display.card_width, display.card_height), border_width)
+        pygame.draw.rect(chrome, card_bg_color, 
+                       (border_width, border_width, 
+                        display.card_width-2*border_width, display.card_height-2*border_width))
+        
+        # Name and level circle share the top line with XP and wounds
+        y_offset = 10
+        name_surface = self._text('xlarge', name, text_color)
+        chrome.blit(name_surface, (10, y_offset))
         
+        # Level color indicator circle after name (sized to match font height)
+        name_width = name_surface.get_width()
+        name_height = name_surface.get_height()
+        level_color = display.level_colors.get(level, self._c_gray)
+        circle_radius = name_height // 2 - 2  # Slightly smaller than half font height
+        circle_x = 10 + name_width + 15
+        circle_y = y_offset + name_height // 2  # Center with name text
+        pygame.draw.circle(chrome, level_color, (circle_x, circle_y), circle_radius)
+        pygame.draw.circle(chrome, self._c_black, (circle_x, circle_y), circle_radius, 2)
+        return chrome
+    
+    def _draw_survivor_card(self, card_x: int, card_y: int, screen_card_y: int, survivor_data: Dict[str, Any],
+                            survivor_entity: Optional[Survivor], is_active: bool, is_dead: bool) -> int:
+        """Draw a survivor card at (card_x, card_y) and return the y offset below its content."""
         # Card background - dark gray for dead survivors
         if is_dead:
-            border_color = self.config.get_color('dark_gray')
+            border_color = self._c_dark_gray
             border_width = 3
             card_bg_color = (80, 80, 80)  # Dark gray background for dead survivors
             text_color = (160, 160, 160)  # Lighter gray text for dead survivors
         else:
-            border_color = self.config.get_color('cyan') if is_active else self.config.get_color('white')
+            border_color = self._c_cyan if is_active else self._c_white
             border_width = 5 if is_active else 3
             card_bg_color = (200, 200, 200)  # Normal background
-            text_color = self.config.get_color('cyan') if is_active else self.config.get_color('black')
+            text_color = self._c_cyan if is_active else self._c_black
         
-        pygame.draw.rect(self.screen, border_color, 
-                       (card_x, card_y, self.config.display.card_width, self.config.display.card_height), border_width)
-        pygame.draw.rect(self.screen, card_bg_color, 
-                       (card_x+border_width, card_y+border_width, 
-                        self.config.display.card_width-2*border_width, self.config.display.card_height-2*border_width))
+        # Border, background, name and level circle only change with the card's state
+        chrome_key = (survivor_data['name'], survivor_data['level'], border_color, border_width,
+                      card_bg_color, text_color)
+        chrome = self._card_chrome.get(chrome_key)
+        if chrome is None:
+            chrome = self._card_chrome[chrome_key] = self._build_card_chrome(*chrome_key)
+        self.screen.blit(chrome, (card_x, card_y))
         
         y_offset = 10
         line_height = 18
         
-        # Name, level circle, XP, and wounds all on the same line
-        name_color = text_color
-        name_surface = self.config.get_font('xlarge').render(survivor_data['name'], True, name_color)
-        self.screen.blit(name_surface, (card_x + 10, card_y + y_offset))
-        
-        # Level color indicator circle after name (sized to match font height)
-        name_width = name_surface.get_width()
-        name_height = name_surface.get_height()
-        level_color = self.config.display.level_colors.get(survivor_data['level'], self.config.get_color('gray'))
-        circle_radius = name_height // 2 - 2  # Slightly smaller than half font height
-        circle_x = card_x + 10 + name_width + 15
-        circle_y = card_y + y_offset + name_height // 2  # Center with name text
-        pygame.draw.circle(self.screen, level_color, (circle_x, circle_y), circle_radius)
-        pygame.draw.circle(self.screen, self.config.get_color('black'), (circle_x, circle_y), circle_radius, 2)
-        
         # XP and Wounds on same line as name (right side)
         info_text = f"XP: {survivor_data['exp']} | Wounds: {survivor_data['wounds']}/2"
-        wound_color = self.config.get_color('red') if survivor_data['wounds'] >= 2 else text_color
-        info_surface = self.config.get_font('medium').render(info_text, True, wound_color)
-        info_x = card_x + self.config.display.card_width - info_surface.get_width() - 10
+        wound_color = self._c_red if survivor_data['wounds'] >= 2 else text_color
+        info_surface = self._text('medium', info_text, wound_color)
+        info_x = card_x + self._display.card_width - info_surface.get_width() - 10
         self.screen.blit(info_surface, (info_x, card_y + y_offset + 5))  # Slight vertical offset to align with name
         
         y_offset += 25
@@ -444,13 +914,13 @@ class UIRenderer(BaseRenderer):
         # Actions remaining (if available) - don't show for dead survivors
         if survivor_entity and not is_dead:
             actions_text = f"Actions: {survivor_entity.actions_remaining}/3"
-            actions_color = self.config.get_color('red') if survivor_entity.actions_remaining == 0 else text_color
-            actions_surface = self.config.get_font('medium').render(actions_text, True, actions_color)
+            actions_color = self._c_red if survivor_entity.actions_remaining == 0 else text_color
+            actions_surface = self._text('medium', actions_text, actions_color)
             self.screen.blit(actions_surface, (card_x + 10, card_y + y_offset))
         elif is_dead:
             # Show "DEAD" message for dead survivors
             dead_text = "DEAD - Cannot Act"
-            dead_surface = self.config.get_font('medium').render(dead_text, True, self.config.get_color('red'))
+            dead_surface = self._text('medium', dead_text, self._c_red)
             self.screen.blit(dead_surface, (card_x + 10, card_y + y_offset))
         
         y_offset += 30
@@ -462,19 +932,19 @@ class UIRenderer(BaseRenderer):
         
         # Display weapons label
         weapons_label = "Weapons:"
-        weapons_label_surface = self.config.get_font('medium').render(weapons_label, True, text_color)
+        weapons_label_surface = self._text('medium', weapons_label, text_color)
         self.screen.blit(weapons_label_surface, (card_x + 10, card_y + y_offset))
         
         # Calculate positions for centered weapon names and stats
         weapons_start_x = card_x + 10 + weapons_label_surface.get_width() + 10
-        weapons_width = self.config.display.card_width - (weapons_start_x - card_x) - 20
+        weapons_width = self._display.card_width - (weapons_start_x - card_x) - 20
         
         # Display weapon names and characteristics with proper alignment
         self._render_aligned_weapons(weapons_start_x, card_y + y_offset, weapons_width, left_hand, right_hand, line_height, text_color, is_dead)
         y_offset += line_height * 2 + 5  # Space for weapon names and stats
         
         # Inventory section
-        inv_title = self.config.get_font('medium').render("Inventory:", True, text_color)
+        inv_title = self._text('medium', "Inventory:", text_color)
         self.screen.blit(inv_title, (card_x + 10, card_y + y_offset))
         y_offset += line_height + 5
         
@@ -487,18 +957,18 @@ class UIRenderer(BaseRenderer):
         
         if inventory_items:
             for item in inventory_items:
-                item_surface = self.config.get_font('small').render(f"• {item}", True, text_color)
+                item_surface = self._text('small', f"• {item}", text_color)
                 self.screen.blit(item_surface, (card_x + 15, card_y + y_offset))
                 y_offset += line_height
         else:
-            empty_surface = self.config.get_font('small').render("• Empty", True, text_color)
+            empty_surface = self._text('small', "• Empty", text_color)
             self.screen.blit(empty_surface, (card_x + 15, card_y + y_offset))
             y_offset += line_height
         
         y_offset += 15
         
         # Skills section
-        skills_title = self.config.get_font('medium').render("Skills:", True, text_color)
+        skills_title = self._text('medium', "Skills:", text_color)
         self.screen.blit(skills_title, (card_x + 10, card_y + y_offset))
         y_offset += line_height + 5
         
@@ -519,25 +989,36 @@ class UIRenderer(BaseRenderer):
         # Display current skills
         for skill in skills_to_show:
             # Wrap long skill text
-            skill_lines = self._wrap_text(skill, self.config.display.card_width - 40)
+            skill_lines = self._wrap_text(skill, self._display.card_width - 40)
             for line in skill_lines:
-                if y_offset + line_height > card_y + self.config.display.card_height - 10:
+                if y_offset + line_height > screen_card_y + self._display.card_height - 10:
                     break  # Don't draw outside card bounds
-                skill_surface = self.config.get_font('small').render(f"• {line}", True, text_color)
+                skill_surface = self._text('small', f"• {line}", text_color)
                 self.screen.blit(skill_surface, (card_x + 15, card_y + y_offset))
                 y_offset += line_height
+        
+        return y_offset
     
     def _wrap_text(self, text: str, max_width: int) -> List[str]:
         """Wrap text to fit within specified width."""
+        key = (text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = self._wrap_cache[key] = self._wrap_words(text, max_width)
+        return lines
+    
+    def _wrap_words(self, text: str, max_width: int) -> List[str]:
+        """Split text into lines no wider than max_width in the small font."""
+        # Font.size measures the line without rasterizing it
+        measure = self.config.get_font('small').size
         words = text.split()
         lines = []
         current_line = ""
         
         for word in words:
             test_line = current_line + (" " if current_line else "") + word
-            test_surface = self.config.get_font('small').render(test_line, True, self.config.get_color('black'))
             
-            if test_surface.get_width() <= max_width:
+            if measure(test_line)[0] <= max_width:
                 current_line = test_line
             else:
                 if current_line:
@@ -553,11 +1034,9 @@ class UIRenderer(BaseRenderer):
     
     def _render_aligned_weapons(self, start_x: int, start_y: int, total_width: int, left_weapon: str, right_weapon: str, line_height: int, text_color=None, is_dead=False):
         """Render weapon names and stats with perfect alignment."""
-        from core.game_setup import GameSetup
-        
         # Use default colors if not provided
         if text_color is None:
-            text_color = self.config.get_color('black')
+            text_color = self._c_black
         
         # Calculate two equal columns for left and right weapons
         column_width = total_width // 2
@@ -568,18 +1047,14 @@ class UIRenderer(BaseRenderer):
         if left_weapon.lower() != "empty":
             # Left weapon name
             left_name = f"[{left_weapon}]"
-            left_name_surface = self.config.get_font('medium').render(left_name, True, text_color)
+            left_name_surface = self._text('medium', left_name, text_color)
             left_name_x = left_column_x + (column_width - left_name_surface.get_width()) // 2  # Center in column
             self.screen.blit(left_name_surface, (left_name_x, start_y))
             
             # Left weapon stats
-            weapon_data = GameSetup.get_weapon_stats(left_weapon)
-            if weapon_data:
-                left_stats = f"[{weapon_data['range']}/{weapon_data['dice']}/{weapon_data['target']}/{weapon_data['damage']}]"
-            else:
-                left_stats = "[No stats]"
+            left_stats = _format_weapon_stats(left_weapon)
             
-            left_stats_surface = self.config.get_font('small').render(left_stats, True, text_color)
+            left_stats_surface = self._text('small', left_stats, text_color)
             left_stats_x = left_column_x + (column_width - left_stats_surface.get_width()) // 2  # Center in column
             self.screen.blit(left_stats_surface, (left_stats_x, start_y + line_height))
         
@@ -587,18 +1062,14 @@ class UIRenderer(BaseRenderer):
         if right_weapon.lower() != "empty":
             # Right weapon name
             right_name = f"[{right_weapon}]"
-            right_name_surface = self.config.get_font('medium').render(right_name, True, text_color)
+            right_name_surface = self._text('medium', right_name, text_color)
             right_name_x = right_column_x + (column_width - right_name_surface.get_width()) // 2  # Center in column
             self.screen.blit(right_name_surface, (right_name_x, start_y))
             
             # Right weapon stats
-            weapon_data = GameSetup.get_weapon_stats(right_weapon)
-            if weapon_data:
-                right_stats = f"[{weapon_data['range']}/{weapon_data['dice']}/{weapon_data['target']}/{weapon_data['damage']}]"
-            else:
-                right_stats = "[No stats]"
+            right_stats = _format_weapon_stats(right_weapon)
             
-            right_stats_surface = self.config.get_font('small').render(right_stats, True, text_color)
+            right_stats_surface = self._text('small', right_stats, text_color)
             right_stats_x = right_column_x + (column_width - right_stats_surface.get_width()) // 2  # Center in column
             self.screen.blit(right_stats_surface, (right_stats_x, start_y + line_height))
 
@@ -619,13 +1090,90 @@ class RenderingSystem:
         self.map_renderer = MapRenderer(screen, config_manager)
         self.entity_renderer = EntityRenderer(screen, config_manager)
         self.ui_renderer = UIRenderer(screen, config_manager)
+        
+        # Clear color, snapshotted like the renderers' palette entries
+        self._c_black = config_manager.get_color('black')
+        
+        # Screen strips redrawn independently, and the state key each was last drawn for
+        self._regions = self._layout_regions()
+        self._region_keys: List[Any] = []
+    
+    def refresh(self):
+        """Pick up changed display configuration (colors, fonts, layout) and redraw everything."""
+        self._c_black = self.config.get_color('black')
+        for renderer in (self.map_renderer, self.entity_renderer, self.ui_renderer):
+            renderer.refresh()
+        self._regions = self._layout_regions()
+        self.invalidate()
+    
+    def _layout_regions(self) -> Optional[List[pygame.Rect]]:
+        """
+        Split the window into world, survivor card and turn window strips.
+        
+        Returns None when the configured layout makes them overlap, in which
+        case every frame is drawn in full.
+        """
+        display = self.config.display
+        height = display.window_height
+        world_right = (display.map_start_x + display.tile_size * display.zone_pixel_size
+                       + MapRenderer.MAP_CACHE_MARGIN)
+        cards_x = display.card_start_x
+        info_x = display.window_width - UIRenderer.INFO_WIDTH - 20
+        if not world_right <= cards_x <= cards_x + display.card_width <= info_x:
+            return None
+        return [
+            pygame.Rect(0, 0, cards_x, height),
+            pygame.Rect(cards_x, 0, info_x - cards_x, height),
+            pygame.Rect(info_x, 0, display.window_width - info_x, height)
+        ]
+    
+    def invalidate(self):
+        """Force the next frame to be redrawn in full."""
+        self._region_keys = []
     
     def render(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]):
-        """Render complete frame using all specialized renderers."""
-        # Clear screen
-        self.screen.fill(self.config.get_color('black'))
+        """Render complete frame, redrawing only the screen regions whose content changed."""
+        black = self._c_black
+        
+        if self._regions is None:
+            self.screen.fill(black)
+            self._render_world(game_world, ui_state)
+            self._render_survivor_cards(game_world, ui_state)
+            self._render_turn_info(game_world, ui_state)
+            pygame.display.flip()
+            return
+        
+        keys = [
+            (self.map_renderer.state_key(game_world.get('map_data')),
+             self.entity_renderer.state_key(game_world.get('survivors'), game_world.get('zombies'),
+                                            ui_state.get('current_survivor'))),
+            self._survivor_cards_key(game_world, ui_state),
+            self._turn_info_key(game_world, ui_state)
+        ]
+        last_keys = self._region_keys or [object()] * len(keys)
+        draws = (self._render_world, self._render_survivor_cards, self._render_turn_info)
+        
+        screen = self.screen
+        dirty_rects = []
+        add_dirty = dirty_rects.append
+        for region, key, last_key, draw in zip(self._regions, keys, last_keys, draws):
+            if key == last_key:
+                continue
+            # Renderers never reach outside their strip, the clip only guards against it
+            screen.set_clip(region)
+            try:
+                screen.fill(black, region)
+                draw(game_world, ui_state)
+            finally:
+                screen.set_clip(None)
+            add_dirty(region)
+        self._region_keys = keys
         
-        # Render game world
+        # Only the redrawn strips are pushed to the display; idle frames push nothing
+        pygame.display.update(dirty_rects)
+    
+    def _render_world(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]):
+        """Render the map with survivor and zombie tokens on top."""
         if 'map_data' in game_world:
             self.map_renderer.render(game_world['map_data'])
         
@@ -637,17 +1185,37 @@ class RenderingSystem:
         
         if 'zombies' in game_world:
             self.entity_renderer.render_zombies(game_world['zombies'])
-        
-        # Render UI elements
+    
+    def _turn_info_args(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]) -> tuple:
+        """Arguments for UIRenderer.render_turn_info taken from the frame state."""
+        return (
+            ui_state['turn_info'],
+            ui_state.get('current_survivor'),
+            ui_state.get('available_actions') if ui_state.get('show_action_menu') else None,
+            game_world.get('survivors', []),  # Pass survivor list
+            ui_state.get('combat_info')  # Pass combat info
+        )
+    
+    def _turn_info_key(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]) -> Optional[tuple]:
+        """State key of the turn window strip."""
+        if 'turn_info' not in ui_state:
+            return None
+        return self.ui_renderer.turn_info_key(*self._turn_info_args(game_world, ui_state))
+    
+    def _render_turn_info(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]):
+        """Render the turn control window."""
         if 'turn_info' in ui_state:
-            self.ui_renderer.render_turn_info(
-                ui_state['turn_info'],
-                ui_state.get('current_survivor'),
-                ui_state.get('available_actions') if ui_state.get('show_action_menu') else None,
-                game_world.get('survivors', []),  # Pass survivor list
-                ui_state.get('combat_info')  # Pass combat info
-            )
-        
+            self.ui_renderer.render_turn_info(*self._turn_info_args(game_world, ui_state))
+    
+    def _survivor_cards_key(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]) -> Optional[tuple]:
+        """State key of the survivor card strip."""
+        if 'survivors_data' in game_world and 'survivors' in game_world:
+            return self.ui_renderer.survivor_cards_key(game_world['survivors_data'], game_world['survivors'],
+                                                       ui_state.get('current_survivor'))
+        return None
+    
+    def _render_survivor_cards(self, game_world: Dict[str, Any], ui_state: Dict[str, Any]):
+        """Render the survivor cards."""
         if 'survivors_data' in game_world and 'survivors' in game_world:
             self.ui_renderer.render_survivor_cards(
                 game_world['survivors_data'],
@@ -656,6 +1224,3 @@ class RenderingSystem:
             )
         
         # Action menu is now integrated into turn_info window - no separate rendering needed
-        
-        # Update display
-        pygame.display.flip()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pygame
 import sys
 from enum import Enum, auto
+from functools import lru_cache
 
 # --- Game Data ---
 SURVIVORS = [
@@ -23,30 +24,39 @@ turn_number = 1
 current_state = GameState.SURVIVOR
 survivor_index = 0
 
+# --- Text Cache ---
+@lru_cache(maxsize=None)
+def get_font(size):
+    """SysFont looks the font file up on every call, so load each size once."""
+    return pygame.font.SysFont("Arial", size)
+
+@lru_cache(maxsize=256)
+def render_text(text, size, color):
+    """Rasterize a string once and reuse the surface until its text changes."""
+    return get_font(size).render(text, True, color)
+
 def draw_dashboard(screen):
-    font = pygame.font.SysFont("Arial", 28)
-    small_font = pygame.font.SysFont("Arial", 22)
     pygame.draw.rect(screen, (220, 220, 220), (0, 0, 1200, 120))
-    turn_text = font.render(f"Turn: {turn_number}", True, (0, 0, 0))
-    phase_text = font.render(f"Phase: {current_state.name}", True, (0, 0, 0))
+    turn_text = render_text(f"Turn: {turn_number}", 28, (0, 0, 0))
+    phase_text = render_text(f"Phase: {current_state.name}", 28, (0, 0, 0))
     screen.blit(turn_text, (20, 20))
     screen.blit(phase_text, (220, 20))
     if current_state == GameState.SURVIVOR:
         s = SURVIVORS[survivor_index]
         pygame.draw.rect(screen, (255, 255, 180), (420, 10, 320, 100), 0)
-        name_text = font.render(f"Survivor: {s['name']}", True, (0, 0, 0))
-        actions_text = small_font.render(f"Actions left: {s['actions_left']}", True, (0, 0, 0))
-        options_text = small_font.render("Options: Move (M), Attack (A)", True, (0, 0, 0))
+        name_text = render_text(f"Survivor: {s['name']}", 28, (0, 0, 0))
+        actions_text = render_text(f"Actions left: {s['actions_left']}", 22, (0, 0, 0))
+        options_text = render_text("Options: Move (M), Attack (A)", 22, (0, 0, 0))
         screen.blit(name_text, (440, 20))
         screen.blit(actions_text, (440, 55))
         screen.blit(options_text, (440, 80))
     elif current_state == GameState.ZOMBIE:
-        zombie_text = font.render("Zombie Phase: Zombies move and attack!", True, (180, 0, 0))
+        zombie_text = render_text("Zombie Phase: Zombies move and attack!", 28, (180, 0, 0))
         screen.blit(zombie_text, (420, 50))
     elif current_state == GameState.SPAWN:
-        spawn_text = font.render("Spawn Phase: 1 Walker Zombie spawned!", True, (120, 0, 0))
+        spawn_text = render_text("Spawn Phase: 1 Walker Zombie spawned!", 28, (120, 0, 0))
         screen.blit(spawn_text, (420, 50))
-    zombie_count_text = small_font.render(f"Zombies on board: {len(ZOMBIES)}", True, (60, 60, 60))
+    zombie_count_text = render_text(f"Zombies on board: {len(ZOMBIES)}", 22, (60, 60, 60))
     screen.blit(zombie_count_text, (900, 20))
 
 def survivor_action(action):
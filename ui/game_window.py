@@ -1,11 +1,20 @@
 import pygame
 import json
 import sys
+from collections import OrderedDict
 from core.turn_manager import TurnManager, TurnPhase
 from core.entities import GameState, Survivor, Zombie
 from core.actions import Position
+from utils.json_loader import load_json
+from systems.rendering_system import (
+    build_zone_draw_list, build_zone_tiles, tokens_fitting, visible_token_slots
+)
+
 
 class GameWindow:
+    # Maximum number of rendered text surfaces kept between frames
+    TEXT_CACHE_SIZE = 512
+    
     def __init__(self, width=1200, height=900, title="Zombicide Game"):
         """Initialize game window with pygame"""
         pygame.init()
@@ -36,14 +45,27 @@ class GameWindow:
         self.MAP_START_X = 50
         self.MAP_START_Y = 50
         self.WALL_WIDTH = 4
+        # Room around the zone grid for walls and opened doors that stick out of it
+        self.MAP_MARGIN = 24
         
         # Fonts
         self.font_large = pygame.font.Font(None, 24)
         self.font_medium = pygame.font.Font(None, 18)
         self.font_small = pygame.font.Font(None, 14)
+        # (font id, text, color) -> rendered surface, least recently used first
+        self._text_cache = OrderedDict()
+        # Turn information box and the (turn, phase, complete) values it shows
+        self._hud_surface = None
+        self._hud_key = None
         
         # Game data
         self.map_data = None
+        # Pre-rendered map region and the screen position it is blitted at
+        self.map_surface = None
+        self.map_surface_pos = (0, 0)
+        # Flattened zones of map_data, and the zone tiles drawn for them
+        self._zone_draw_list = []
+        self._zone_tile_surfaces = None
         self.survivors_data = None
         self.game_state = GameState()
         
@@ -55,24 +77,47 @@ class GameWindow:
     def load_map(self, json_path, map_index=0):
         """Load map data from JSON file."""
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            data = load_json(json_path)
             self.map_data = data["maps"][map_index]
             print(f"Loaded map: {self.map_data.get('name', 'Unnamed')}")
         except (FileNotFoundError, KeyError, IndexError, json.JSONDecodeError) as e:
             print(f"Error loading map data: {e}")
             self.map_data = None
+        self._build_zone_draw_list()
+        self.build_map_surface()
+    
+    def build_map_surface(self):
+        """Pre-render the static map; call again after opening or closing a door."""
+        if not self.map_data:
+            self.map_surface = None
+            return
+        
+        margin = self.MAP_MARGIN
+        size = self.TILE_SIZE * self.ZONE_PIXEL_SIZE + 2 * margin
+        self.map_surface_pos = (self.MAP_START_X - margin, self.MAP_START_Y - margin)
+        
+        map_surface = pygame.Surface((size, size), 0, self.screen)
+        # The map is drawn over the cleared screen, so the margin uses the clear color
+        map_surface.fill(self.BLACK)
+        
+        # The drawing helpers target self.screen, so point it at the map surface meanwhile
+        screen = self.screen
+        self.screen = map_surface
+        try:
+            self._draw_zones(margin - self.MAP_START_X, margin - self.MAP_START_Y)
+        finally:
+            self.screen = screen
+        self.map_surface = map_surface
     
     def load_survivors(self, json_path):
         """Load survivor data from JSON file."""
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            data = load_json(json_path)
             self.survivors_data = data["survivors"]
             print(f"Loaded {len(self.survivors_data)} survivors")
             
             # Initialize survivors in game state
-            self.game_state.survivors.clear()
+            self.game_state.clear_survivors()
             for i, survivor_data in enumerate(self.survivors_data):
                 survivor_id = f"survivor_{i}"
                 # Start survivors in zone (0,2) - top right
@@ -81,12 +126,26 @@ class GameWindow:
                 self.game_state.add_survivor(survivor)
             
             # Initialize zombies list (zombies will spawn during gameplay)
-            self.game_state.zombies.clear()
+            self.game_state.clear_zombies()
             
         except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
             print(f"Error loading survivor data: {e}")
             self.survivors_data = []
 
+    def _render_text(self, font, text, color):
+        """Render antialiased text with one of the window fonts, reusing earlier identical calls."""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            cache[key] = surface
+            if len(cache) > self.TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+
     def draw_door(self, x, y, direction, opened=False):
         """Draw a door on the wall."""
         door_size = 40
@@ -149,40 +208,42 @@ class GameWindow:
 
     def draw_map(self):
         """Draw the map using pygame."""
+        if self.map_surface is not None:
+            self.screen.blit(self.map_surface, self.map_surface_pos)
+    
+    def _build_zone_draw_list(self):
+        """Flatten the loaded map's zones into (x, y, is_building, walls) entries."""
         if not self.map_data:
+            self._zone_draw_list = []
             return
-            
-        tile = self.map_data["tiles"][0][0]  # Only one tile for this map
-        zones = tile["zones"]
-
-        # Draw zones
-        for zr in range(self.TILE_SIZE):
-            for zc in range(self.TILE_SIZE):
-                zone = zones[zr][zc]
-                
-                # Calculate zone position
-                x = self.MAP_START_X + zc * self.ZONE_PIXEL_SIZE
-                y = self.MAP_START_Y + zr * self.ZONE_PIXEL_SIZE
-
-                # Set color based on zone type
-                color = self.BUILDING_COLOR if "building" in zone["features"] else self.STREET_COLOR
+        self._zone_draw_list = build_zone_draw_list(
+            self.map_data["tiles"][0][0]["zones"],  # Only one tile for this map
+            self.TILE_SIZE, self.MAP_START_X, self.MAP_START_Y, self.ZONE_PIXEL_SIZE)
+    
+    def _zone_tiles(self):
+        """Return (street, building) zone tiles with background and border pre-drawn."""
+        if self._zone_tile_surfaces is None:
+            self._zone_tile_surfaces = build_zone_tiles(
+                self.ZONE_PIXEL_SIZE, self.STREET_COLOR, self.BUILDING_COLOR, self.BLACK, self.screen)
+        return self._zone_tile_surfaces
+    
+    def _draw_zones(self, offset_x=0, offset_y=0):
+        """Draw zone backgrounds, walls and doors, shifted by the given offset.
 
-                # Draw zone background
-                pygame.draw.rect(self.screen, color, 
-                               (x, y, self.ZONE_PIXEL_SIZE, self.ZONE_PIXEL_SIZE))
-                
-                # Draw zone border
-                pygame.draw.rect(self.screen, self.BLACK,
-                               (x, y, self.ZONE_PIXEL_SIZE, self.ZONE_PIXEL_SIZE), 2)
-                
-                # Draw connections (walls and doors)
-                conns = zone.get("connections", {})
-                for direction, conn in conns.items():
-                    if conn["type"] == "wall":
-                        self.draw_wall(x, y, direction)
-                        if "door" in conn:
-                            opened = conn.get("opened", False)
-                            self.draw_door(x, y, direction, opened)
+        Zones are drawn strictly in order, as each zone's background covers the
+        parts of earlier zones' walls and doors that reach into it.
+        """
+        zone_tiles = self._zone_tiles()
+        for x, y, is_building, walls in self._zone_draw_list:
+            x += offset_x
+            y += offset_y
+            self.screen.blit(zone_tiles[is_building], (x, y))
+            
+            # Draw connections (walls and doors)
+            for direction, door in walls:
+                self.draw_wall(x, y, direction)
+                if door is not None:
+                    self.draw_door(x, y, direction, door.get("opened", False))
     
     def draw_survivor_tokens(self):
         """Draw survivor tokens at their current positions - white circles with black borders and names."""
@@ -200,12 +261,11 @@ class GameWindow:
         
         # Group survivors by position
         survivors_by_position = {}
-        for survivor in self.game_state.survivors:
-            if survivor.alive:
-                pos_key = (survivor.position.row, survivor.position.col)
-                if pos_key not in survivors_by_position:
-                    survivors_by_position[pos_key] = []
-                survivors_by_position[pos_key].append(survivor)
+        for survivor in self.game_state.alive_survivors:
+            pos_key = (survivor.position.row, survivor.position.col)
+            if pos_key not in survivors_by_position:
+                survivors_by_position[pos_key] = []
+            survivors_by_position[pos_key].append(survivor)
         
         # Draw survivors at each position
         for (row, col), survivors in survivors_by_position.items():
@@ -213,23 +273,12 @@ class GameWindow:
             zone_y = self.MAP_START_Y + row * self.ZONE_PIXEL_SIZE
             
             # Position tokens within the zone
-            tokens_per_row = min(3, len(survivors))
-            spacing = 10
-            start_x = zone_x + spacing
-            start_y = zone_y + spacing
-            
-            for i, survivor in enumerate(survivors):
-                # Calculate position for each token
-                token_row = i // tokens_per_row
-                token_col = i % tokens_per_row
-                
-                token_x = start_x + token_col * (token_diameter + spacing) + token_radius
-                token_y = start_y + token_row * (token_diameter + spacing) + token_radius
-                
-                # Make sure token stays within zone bounds
-                if token_x + token_radius > zone_x + self.ZONE_PIXEL_SIZE or \
-                   token_y + token_radius > zone_y + self.ZONE_PIXEL_SIZE:
-                    continue
+            fitting = tokens_fitting(self.ZONE_PIXEL_SIZE, token_diameter, token_radius, 10)
+            for i, dx, dy in visible_token_slots(min(3, len(survivors)), len(survivors), fitting,
+                                                 10 + token_radius, token_diameter + 10):
+                survivor = survivors[i]
+                token_x = zone_x + dx
+                token_y = zone_y + dy
                 
                 # Color based on survivor status - cyan if active, white otherwise
                 if current_survivor and survivor.id == current_survivor.id:
@@ -242,7 +291,7 @@ class GameWindow:
                 pygame.draw.circle(self.screen, self.BLACK, (token_x, token_y), token_radius, border_width)
                 
                 # Draw survivor name in the middle
-                name_surface = self.font_small.render(survivor.name, True, self.BLACK)
+                name_surface = self._render_text(self.font_small, survivor.name, self.BLACK)
                 name_rect = name_surface.get_rect(center=(token_x, token_y))
                 self.screen.blit(name_surface, name_rect)
     
@@ -259,12 +308,11 @@ class GameWindow:
         
         # Group zombies by position
         zombies_by_position = {}
-        for zombie in self.game_state.zombies:
-            if zombie.alive:
-                pos_key = (zombie.position.row, zombie.position.col)
-                if pos_key not in zombies_by_position:
-                    zombies_by_position[pos_key] = []
-                zombies_by_position[pos_key].append(zombie)
+        for zombie in self.game_state.alive_zombies:
+            pos_key = (zombie.position.row, zombie.position.col)
+            if pos_key not in zombies_by_position:
+                zombies_by_position[pos_key] = []
+            zombies_by_position[pos_key].append(zombie)
         
         # Draw zombies at each position
         for (row, col), zombies in zombies_by_position.items():
@@ -272,30 +320,18 @@ class GameWindow:
             zone_y = self.MAP_START_Y + row * self.ZONE_PIXEL_SIZE
             
             # Position tokens within the zone
-            tokens_per_row = min(3, len(zombies))
-            spacing = 20
-            start_x = zone_x + spacing
-            start_y = zone_y + spacing
-            
-            for i, zombie in enumerate(zombies):
-                # Calculate position for each token
-                token_row = i // tokens_per_row
-                token_col = i % tokens_per_row
-                
-                token_x = start_x + token_col * (token_diameter + spacing) + token_radius
-                token_y = start_y + token_row * (token_diameter + spacing) + token_radius
-                
-                # Make sure token stays within zone bounds
-                if token_x + token_radius > zone_x + self.ZONE_PIXEL_SIZE or \
-                   token_y + token_radius > zone_y + self.ZONE_PIXEL_SIZE:
-                    continue
+            fitting = tokens_fitting(self.ZONE_PIXEL_SIZE, token_diameter, token_radius, 20)
+            for i, dx, dy in visible_token_slots(min(3, len(zombies)), len(zombies), fitting,
+                                                 20 + token_radius, token_diameter + 20):
+                token_x = zone_x + dx
+                token_y = zone_y + dy
                 
                 # Draw dark grey circle with black border
                 pygame.draw.circle(self.screen, DARK_GRAY, (token_x, token_y), token_radius)
                 pygame.draw.circle(self.screen, self.BLACK, (token_x, token_y), token_radius, border_width)
                 
                 # Draw 'Z' in the middle
-                z_surface = self.font_medium.render('Z', True, self.WHITE)
+                z_surface = self._render_text(self.font_medium, 'Z', self.WHITE)
                 z_rect = z_surface.get_rect(center=(token_x, token_y))
                 self.screen.blit(z_surface, z_rect)
     
@@ -306,34 +342,49 @@ class GameWindow:
         # Position in top-left corner
         info_x = 10
         info_y = 10
+        
+        # The box only shows these values, so it is redrawn only when they change
+        hud_key = (turn_info['turn_number'], turn_info['phase_name'], turn_info['phase_complete'])
+        if hud_key != self._hud_key:
+            self._hud_surface = self._build_turn_info_surface(turn_info)
+            self._hud_key = hud_key
+        self.screen.blit(self._hud_surface, (info_x - 5, info_y - 5))
+    
+    def _build_turn_info_surface(self, turn_info):
+        """Draw the turn information box into its own surface."""
+        hud = pygame.Surface((300, 120), 0, self.screen)
+        
+        # Text inset inside the box
+        info_x = 5
+        info_y = 5
         line_height = 25
         
-        # Background rectangle for better readability
-        info_rect = pygame.Rect(info_x - 5, info_y - 5, 300, 120)
-        pygame.draw.rect(self.screen, (0, 0, 0, 180), info_rect)
-        pygame.draw.rect(self.screen, self.WHITE, info_rect, 2)
+        # Solid background for better readability, framed by a white border
+        hud.fill(self.BLACK)
+        pygame.draw.rect(hud, self.WHITE, hud.get_rect(), 2)
         
         # Turn number
         turn_text = f"Turn: {turn_info['turn_number']}"
-        turn_surface = self.font_large.render(turn_text, True, self.WHITE)
-        self.screen.blit(turn_surface, (info_x, info_y))
+        turn_surface = self._render_text(self.font_large, turn_text, self.WHITE)
+        hud.blit(turn_surface, (info_x, info_y))
         
         # Current phase
         phase_text = f"Phase: {turn_info['phase_name']}"
-        phase_surface = self.font_medium.render(phase_text, True, self.WHITE)
-        self.screen.blit(phase_surface, (info_x, info_y + line_height))
+        phase_surface = self._render_text(self.font_medium, phase_text, self.WHITE)
+        hud.blit(phase_surface, (info_x, info_y + line_height))
         
         # Phase status
         status = "Complete" if turn_info['phase_complete'] else "In Progress"
         status_color = self.WHITE if turn_info['phase_complete'] else (255, 255, 0)  # Yellow for in progress
         status_text = f"Status: {status}"
-        status_surface = self.font_small.render(status_text, True, status_color)
-        self.screen.blit(status_surface, (info_x, info_y + line_height * 2))
+        status_surface = self._render_text(self.font_small, status_text, status_color)
+        hud.blit(status_surface, (info_x, info_y + line_height * 2))
         
         # Controls info
         controls_text = "SPACE: Next Phase | P: Pause | ESC: Quit"
-        controls_surface = self.font_small.render(controls_text, True, (200, 200, 200))
-        self.screen.blit(controls_surface, (info_x, info_y + line_height * 3))
+        controls_surface = self._render_text(self.font_small, controls_text, (200, 200, 200))
+        hud.blit(controls_surface, (info_x, info_y + line_height * 3))
+        return hud
 
     def on_phase_change(self, new_phase):
         """Callback when turn phase changes."""
@@ -428,7 +479,7 @@ class GameWindow:
             
             # Draw survivor name with highlighting
             name_color = CYAN if is_active else BLACK
-            name_surface = self.font_large.render(survivor_data['name'], True, name_color)
+            name_surface = self._render_text(self.font_large, survivor_data['name'], name_color)
             name_rect = name_surface.get_rect(centerx=card_x + card_width//2, y=card_y + 10)
             self.screen.blit(name_surface, name_rect)
             
@@ -436,7 +487,7 @@ class GameWindow:
             if survivor_entity:
                 actions_text = f"Actions: {survivor_entity.actions_remaining}/3"
                 actions_color = CYAN if is_active else BLACK
-                actions_surface = self.font_medium.render(actions_text, True, actions_color)
+                actions_surface = self._render_text(self.font_medium, actions_text, actions_color)
                 self.screen.blit(actions_surface, (card_x + 10, card_y + 35))
             
             # Draw level color indicator
@@ -445,15 +496,15 @@ class GameWindow:
             pygame.draw.rect(self.screen, level_color, level_rect)
             pygame.draw.rect(self.screen, BLACK, level_rect, 1)
             
-            level_surface = self.font_medium.render(survivor_data['level'].upper(), True, WHITE)
+            level_surface = self._render_text(self.font_medium, survivor_data['level'].upper(), WHITE)
             level_text_rect = level_surface.get_rect(center=level_rect.center)
             self.screen.blit(level_surface, level_text_rect)
             
             # Draw wounds and experience
-            wounds_surface = self.font_medium.render(f"Wounds: {survivor_data['wounds']}", True, BLACK)
+            wounds_surface = self._render_text(self.font_medium, f"Wounds: {survivor_data['wounds']}", BLACK)
             self.screen.blit(wounds_surface, (card_x + 10, card_y + 95))
             
-            exp_surface = self.font_medium.render(f"XP: {survivor_data['exp']}", True, BLACK)
+            exp_surface = self._render_text(self.font_medium, f"XP: {survivor_data['exp']}", BLACK)
             self.screen.blit(exp_surface, (card_x + 10, card_y + 115))
     
     def draw_action_menu(self):
@@ -481,7 +532,7 @@ class GameWindow:
         current_survivor = self.turn_manager.get_current_survivor()
         if current_survivor:
             title_text = f"{current_survivor.name}'s Turn"
-            title_surface = self.font_large.render(title_text, True, self.WHITE)
+            title_surface = self._render_text(self.font_large, title_text, self.WHITE)
             title_rect = title_surface.get_rect(centerx=menu_x + menu_width//2, y=menu_y + 10)
             self.screen.blit(title_surface, title_rect)
         
@@ -491,12 +542,12 @@ class GameWindow:
         
         for i, action in enumerate(available_actions):
             action_text = f"{i+1}. {action}"
-            action_surface = self.font_medium.render(action_text, True, self.WHITE)
+            action_surface = self._render_text(self.font_medium, action_text, self.WHITE)
             self.screen.blit(action_surface, (menu_x + 20, actions_start_y + i * line_height))
         
         # Draw instructions
         instruction_text = "Press 1, 2, or 3 to select action"
-        instruction_surface = self.font_small.render(instruction_text, True, (200, 200, 200))
+        instruction_surface = self._render_text(self.font_small, instruction_text, (200, 200, 200))
         instruction_rect = instruction_surface.get_rect(centerx=menu_x + menu_width//2, 
                                                        y=menu_y + menu_height - 30)
         self.screen.blit(instruction_surface, instruction_rect)
@@ -0,0 +1,32 @@
+"""
+JSON loading helpers for the Zombicide data files.
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def load_json(json_path: str) -> Any:
+    """
+    Load and parse a JSON file.
+
+    Args:
+        json_path: Path to the JSON file
+
+    Returns:
+        The parsed JSON document
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON (orjson's decode
+            error is a subclass, so callers can catch it the same way)
+    """
+    with open(json_path, 'rb') as f:
+        return _loads(f.read())